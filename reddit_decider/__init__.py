@@ -47,6 +47,10 @@ try:
 except PackageNotFoundError:
     _pkg_version = ""
 
+# label children are bound on first use (so no zero-valued series are exported up front) and
+# cached, so `make_object_for_context()` only pays for `labels()` once per failure type
+_MAKE_OBJECT_FAILURE_COUNTERS: Dict[str, Any] = {}
+
 logger = logging.getLogger(__name__)
 
 EMPLOYEE_ROLES = ["employee", "contractor"]
@@ -58,6 +62,8 @@ IDENTIFIERS = [
     "ad_account_id",
     "business_id",
 ]
+# membership checks use the set; `IDENTIFIERS` keeps its order for error messages
+_IDENTIFIER_SET = frozenset(IDENTIFIERS)
 TYPE_STR_LOOKUP = {bool: "boolean", int: "integer", float: "float", str: "string", dict: "map"}
 
 
@@ -150,12 +156,15 @@ class DeciderContext:
         ef = deepcopy(self._extracted_fields or {})
 
         app_fields = {}
-        if ef.get("app_name"):
-            app_fields["name"] = ef["app_name"]
-        if ef.get("app_version"):
-            app_fields["version"] = ef["app_version"]
-        if ef.get("build_number"):
-            app_fields["build_number"] = ef["build_number"]
+        app_name = ef.get("app_name")
+        if app_name:
+            app_fields["name"] = app_name
+        app_version = ef.get("app_version")
+        if app_version:
+            app_fields["version"] = app_version
+        build_number = ef.get("build_number")
+        if build_number:
+            app_fields["build_number"] = build_number
         if self._locale:
             app_fields["relevant_locale"] = self._locale
 
@@ -164,8 +173,9 @@ class DeciderContext:
             geo_fields["country_code"] = self._country_code
 
         request_fields = {}
-        if ef.get("canonical_url"):
-            request_fields["canonical_url"] = ef["canonical_url"]
+        canonical_url = ef.get("canonical_url")
+        if canonical_url:
+            request_fields["canonical_url"] = canonical_url
 
         platform_fields = {}
         if self._device_id:
@@ -215,6 +225,7 @@ class Decider:
         self._internal: RustDecider = internal
         self._span = server_span
         self._context_name = context_name
+        self._ctx: Optional[Dict[str, Any]] = None
         if event_logger:
             self._event_logger = event_logger
         else:
@@ -223,6 +234,13 @@ class Decider:
     def internal_decider(self) -> RustDecider:
         return self._internal
 
+    def _get_ctx(self) -> Dict[str, Any]:
+        # `Decider` is instantiated per request, so the bucketing context is
+        # built once and shared by every lookup made during that request
+        if self._ctx is None:
+            self._ctx = self._decider_context.to_dict()
+        return self._ctx
+
     def _send_expose(self, event: str, exposure_fields: dict) -> None:
         event_fields = deepcopy(exposure_fields)
         try:
@@ -240,7 +258,8 @@ class Decider:
             ) = event.split("::::")
         except ValueError:
             logger.warning(
-                f'Encountered error in event.split("::::") for event: {event}. Exposure not emitted.'
+                'Encountered error in event.split("::::") for event: %s. Exposure not emitted.',
+                event,
             )
             return
 
@@ -283,7 +302,8 @@ class Decider:
             ) = event.split("::::")
         except ValueError:
             logger.warning(
-                f'Encountered error in event.split("::::") for event: {event}. Exposure not emitted.'
+                'Encountered error in event.split("::::") for event: %s. Exposure not emitted.',
+                event,
             )
             return
 
@@ -320,7 +340,7 @@ class Decider:
         try:
             out = int(input)
         except ValueError as e:
-            logger.info(f"Encountered error casting to integer: {e}")
+            logger.info("Encountered error casting to integer: %s", e)
         return out
 
     def get_variant(
@@ -344,7 +364,7 @@ class Decider:
 
         :return: Variant name if a variant is assigned, :code:`None` otherwise.
         """
-        ctx = self._decider_context.to_dict()
+        ctx = self._get_ctx()
         decision = self._get_decision(experiment_name, ctx)
 
         if decision is None:
@@ -373,7 +393,7 @@ class Decider:
 
         :return: Variant name if a variant is assigned, None otherwise.
         """
-        ctx = self._decider_context.to_dict()
+        ctx = self._get_ctx()
         decision = self._get_decision(experiment_name, ctx)
 
         if decision is None:
@@ -485,13 +505,15 @@ class Decider:
 
         :return: Variant name if a variant is assigned, None otherwise.
         """
-        if identifier_type not in IDENTIFIERS:
+        if identifier_type not in _IDENTIFIER_SET:
             logger.warning(
-                f'"{identifier_type}" is not one of supported "identifier_type": {IDENTIFIERS}.'
+                '"%s" is not one of supported "identifier_type": %s.',
+                identifier_type,
+                IDENTIFIERS,
             )
             return None
 
-        ctx = self._decider_context.to_dict()
+        ctx = dict(self._get_ctx())
         ctx[identifier_type] = identifier
 
         decision = self._get_decision(experiment_name, ctx)
@@ -548,13 +570,15 @@ class Decider:
 
         :return: Variant name if a variant is assigned, None otherwise.
         """
-        if identifier_type not in IDENTIFIERS:
+        if identifier_type not in _IDENTIFIER_SET:
             logger.warning(
-                f'"{identifier_type}" is not one of supported "identifier_type": {IDENTIFIERS}.'
+                '"%s" is not one of supported "identifier_type": %s.',
+                identifier_type,
+                IDENTIFIERS,
             )
             return None
 
-        ctx = self._decider_context.to_dict()
+        ctx = dict(self._get_ctx())
         ctx[identifier_type] = identifier
 
         decision = self._get_decision(experiment_name, ctx)
@@ -600,7 +624,7 @@ class Decider:
 
         :return: list of experiment dicts with non-:code:`None` variants.
         """
-        ctx = self._decider_context.to_dict()
+        ctx = self._get_ctx()
 
         all_decisions = self._get_all_decisions(ctx)
 
@@ -668,13 +692,15 @@ class Decider:
 
         :return: list of experiment dicts with non-:code:`None` variants.
         """
-        if identifier_type not in IDENTIFIERS:
+        if identifier_type not in _IDENTIFIER_SET:
             logger.warning(
-                f'"{identifier_type}" is not one of supported "identifier_type": {IDENTIFIERS}.'
+                '"%s" is not one of supported "identifier_type": %s.',
+                identifier_type,
+                IDENTIFIERS,
             )
             return []
 
-        ctx = self._decider_context.to_dict()
+        ctx = dict(self._get_ctx())
         ctx[identifier_type] = identifier
 
         all_decisions = self._get_all_decisions(ctx=ctx, bucketing_field_filter=identifier_type)
@@ -811,24 +837,46 @@ class Decider:
 
         :return: list of all active dynamic config dicts.
         """
+        value_to_dc_dict = self._value_to_dc_dict
+        return [
+            value_to_dc_dict(feature_name, val)
+            for feature_name, val in self._get_all_values().items()
+        ]
+
+    def get_all_dynamic_configs_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """Return the dynamic configuration dicts of :py:meth:`get_all_dynamic_configs`
+        keyed by their "name" field:
+
+            .. code-block:: json
+
+                {
+                    "example_dc": {
+                        "name": "example_dc",
+                        "type": "float",
+                        "value": 1.0
+                    }
+                }
+
+        :return: dict of all active dynamic config dicts, keyed by dynamic config name.
+        """
+        value_to_dc_dict = self._value_to_dc_dict
+        return {
+            feature_name: value_to_dc_dict(feature_name, val)
+            for feature_name, val in self._get_all_values().items()
+        }
+
+    def _get_all_values(self) -> Dict[str, Any]:
         if self._internal is None:
             logger.error("rs_decider is None--did not initialize.")
-            return []
-
-        ctx = self._decider_context.to_dict()
+            return {}
 
+        # not memoized: every call gets fresh values (including nested maps) from the
+        # internal decider, so callers can't see each other's mutations
         try:
-            values = self._internal.all_values(ctx)
+            return self._internal.all_values(self._get_ctx())
         except DeciderException as exc:
             logger.error("[decider] %s", str(exc))
-            return []
-
-        parsed_configs = []
-
-        for feature_name, val in values.items():
-            parsed_configs.append(self._value_to_dc_dict(feature_name, val))
-
-        return parsed_configs
+            return {}
 
     def _get_decision(
         self,
@@ -867,7 +915,7 @@ class Decider:
         dc_type: Type[T],
         get_fn: Callable[..., Type[T]],
     ) -> T:
-        ctx = self._decider_context.to_dict()
+        ctx = self._get_ctx()
 
         try:
             value = get_fn(feature_name=feature_name, context=ctx)
@@ -978,14 +1026,17 @@ class DeciderContextFactory(ContextFactory):
             # remove invalid keys
             if k is None or not isinstance(k, str):
                 logger.info(
-                    f"{k} key in request_field_extractor() dict is not of type str and is removed."
+                    "%s key in request_field_extractor() dict is not of type str and is removed.",
+                    k,
                 )
                 del parsed_extracted_fields[k]
                 continue
             # remove invalid values
             if not isinstance(v, (int, float, str, bool)) and v is not None:
                 logger.info(
-                    f"{k}: {v} value in `request_field_extractor()` dict is not one of type: [None, int, float, str, bool] and is removed."
+                    "%s: %s value in `request_field_extractor()` dict is not one of type: [None, int, float, str, bool] and is removed.",
+                    k,
+                    v,
                 )
                 del parsed_extracted_fields[k]
         return parsed_extracted_fields
@@ -1007,12 +1058,16 @@ class DeciderContextFactory(ContextFactory):
 
     def make_object_for_context(self, name: str, span: Span) -> Decider:
         def inc_failure_counter(failure_type: str) -> None:
-            experiments_client_counter.labels(
-                operation="make_object_for_context",
-                success="false",
-                error_type=failure_type,
-                pkg_version=_pkg_version,
-            ).inc()
+            counter = _MAKE_OBJECT_FAILURE_COUNTERS.get(failure_type)
+            if counter is None:
+                counter = experiments_client_counter.labels(
+                    operation="make_object_for_context",
+                    success="false",
+                    error_type=failure_type,
+                    pkg_version=_pkg_version,
+                )
+                _MAKE_OBJECT_FAILURE_COUNTERS[failure_type] = counter
+            counter.inc()
 
         # initialize rust decider from watched manifest file
         rs_decider = None
@@ -1020,7 +1075,7 @@ class DeciderContextFactory(ContextFactory):
             rs_decider = self._filewatcher.get_data()
         except WatchedFileNotAvailableError as exc:
             inc_failure_counter("watched_file_not_available")
-            logger.error(f"Experiment config file unavailable: {exc}")
+            logger.error("Experiment config file unavailable: %s", exc)
 
         # check for `span`'s presence
         if span is None:
@@ -1051,7 +1106,8 @@ class DeciderContextFactory(ContextFactory):
         except Exception as exc:
             inc_failure_counter("request_field_extractor")
             logger.error(
-                f"Unable to extract fields from `request_field_extractor()` in `make_object_for_context()`. details: {exc}"
+                "Unable to extract fields from `request_field_extractor()` in `make_object_for_context()`. details: %s",
+                exc,
             )
             # re-raise exception raised by `_request_field_extractor`
             # since it's user-defined & should be made visible
@@ -1079,7 +1135,8 @@ class DeciderContextFactory(ContextFactory):
             cookie_created_timestamp = user_event_fields.get("cookie_created_timestamp")
         except Exception as exc:
             logger.info(
-                f"Error while accessing `user.event_fields()` in `make_object_for_context()`. details: {exc}"
+                "Error while accessing `user.event_fields()` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         loid_created_timestamp = None
@@ -1090,7 +1147,8 @@ class DeciderContextFactory(ContextFactory):
                     loid_created_timestamp = loid_cms
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.authentication_token.loid_created_ms` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.authentication_token.loid_created_ms` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         oauth_client_id = None
@@ -1101,7 +1159,8 @@ class DeciderContextFactory(ContextFactory):
                     oauth_client_id = oc_id
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.authentication_token.oauth_client_id` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.authentication_token.oauth_client_id` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         country_code = None
@@ -1109,7 +1168,8 @@ class DeciderContextFactory(ContextFactory):
             country_code = ec.geolocation.country_code
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.geolocation.country_code` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.geolocation.country_code` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         locale = None
@@ -1117,7 +1177,8 @@ class DeciderContextFactory(ContextFactory):
             locale = ec.locale.locale_code
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.locale.locale_code` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.locale.locale_code` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         origin_service = None
@@ -1125,7 +1186,8 @@ class DeciderContextFactory(ContextFactory):
             origin_service = ec.origin_service.name
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.origin_service.name` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.origin_service.name` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         is_employee = None
@@ -1133,7 +1195,8 @@ class DeciderContextFactory(ContextFactory):
             is_employee = self._is_employee(ec)
         except Exception as exc:
             logger.info(
-                f"Error in `DeciderContextFactory.is_employee(ec)` in `make_object_for_context()`. details: {exc}"
+                "Error in `DeciderContextFactory.is_employee(ec)` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         device_id = None
@@ -1141,7 +1204,8 @@ class DeciderContextFactory(ContextFactory):
             device_id = ec.device.id
         except Exception as exc:
             logger.info(
-                f"Unable to access `ec.device.id` in `make_object_for_context()`. details: {exc}"
+                "Unable to access `ec.device.id` in `make_object_for_context()`. details: %s",
+                exc,
             )
 
         try:
@@ -1161,7 +1225,8 @@ class DeciderContextFactory(ContextFactory):
         except Exception as exc:
             inc_failure_counter("DeciderContext_init_failed")
             logger.warning(
-                f"Could not create full DeciderContext() (defaulting to empty DeciderContext()): {exc}"
+                "Could not create full DeciderContext() (defaulting to empty DeciderContext()): %s",
+                exc,
             )
             decider_context = DeciderContext()
 
@@ -1213,6 +1278,14 @@ class DeciderClient(config.Parser):
         )
 
 
+# the per-prefix spec is immutable, so it is built once rather than on every call
+_DECIDER_CLIENT_CONFIG_SPEC = {
+    "path": config.Optional(config.String, default="/var/local/experiments.json"),
+    "timeout": config.Optional(config.Timespan, default=timedelta(seconds=30)),
+    "backoff": config.Optional(config.Timespan),
+}
+
+
 def decider_client_from_config(
     app_config: config.RawConfig,
     event_logger: EventLogger,
@@ -1249,16 +1322,7 @@ def decider_client_from_config(
     assert prefix.endswith(".")
     config_prefix = prefix[:-1]
 
-    cfg = config.parse_config(
-        app_config,
-        {
-            config_prefix: {
-                "path": config.Optional(config.String, default="/var/local/experiments.json"),
-                "timeout": config.Optional(config.Timespan, default=timedelta(seconds=30)),
-                "backoff": config.Optional(config.Timespan),
-            }
-        },
-    )
+    cfg = config.parse_config(app_config, {config_prefix: _DECIDER_CLIENT_CONFIG_SPEC})
     options = getattr(cfg, config_prefix)
 
     # pylint: disable=maybe-no-member
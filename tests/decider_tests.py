@@ -1,14 +1,17 @@
 import contextlib
 import json
 import logging
+import os
 import tempfile
 import unittest
 
+from copy import copy
+from copy import deepcopy
+from types import SimpleNamespace
 from unittest import mock
 
 from baseplate import RequestContext
-from baseplate import ServerSpan
-from baseplate.lib.events import DebugLogger
+from baseplate.lib.events import EventLogger
 from reddit_edgecontext import ValidatedAuthenticationToken
 
 from reddit_decider import Decider
@@ -17,6 +20,7 @@ from reddit_decider import DeciderContext
 from reddit_decider import DeciderContextFactory
 from reddit_decider import EventType
 from reddit_decider import init_decider_parser
+from reddit_decider.prometheus_metrics import experiments_client_counter
 
 logger = logging.getLogger()
 
@@ -41,105 +45,213 @@ LOID_CREATED_TIMESTAMP = 123456
 LOCALE_CODE = "us_en"
 ORIGIN_SERVICE = "origin"
 SUBREDDIT_ID = "t5_123abc"
+EXTRACTED_FIELDS = {
+    "app_name": APP_NAME,
+    "app_version": APP_VERSION,
+    "build_number": BUILD_NUMBER,
+    "canonical_url": CANONICAL_URL,
+}
+DECIDER_CONTEXT_FIELDS = {
+    "user_id": USER_ID,
+    "logged_in": IS_LOGGED_IN,
+    "country_code": COUNTRY_CODE,
+    "locale": LOCALE_CODE,
+    "origin_service": ORIGIN_SERVICE,
+    "user_is_employee": True,
+    "device_id": DEVICE_ID,
+    "oauth_client_id": AUTH_CLIENT_ID,
+    "cookie_created_timestamp": COOKIE_CREATED_TIMESTAMP,
+    "loid_created_timestamp": LOID_CREATED_TIMESTAMP,
+}
+
+
+# one directory holds every config written by this module & is removed at interpreter exit;
+# it lives on tmpfs where available so config writes never reach disk
+CONFIG_DIR = tempfile.TemporaryDirectory(
+    prefix="decider_tests_", dir="/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+)
 
 
 @contextlib.contextmanager
 def create_temp_config_file(contents):
-    with tempfile.NamedTemporaryFile() as f:
-        f.write(json.dumps(contents).encode())
-        f.seek(0)
+    with tempfile.NamedTemporaryFile("w", dir=CONFIG_DIR.name) as f:
+        f.write(json.dumps(contents))
+        # consumers open the file by name, so it only needs flushing, not rewinding
+        f.flush()
         yield f
 
 
 def decider_field_extractor(_request: RequestContext):
-    return {
-        "app_name": APP_NAME,
-        "app_version": APP_VERSION,
-        "build_number": BUILD_NUMBER,
-        "canonical_url": CANONICAL_URL,
-    }
+    # `DeciderContextFactory` and `DeciderContext` copy before modifying, so the dict can be shared
+    return EXTRACTED_FIELDS
+
+
+def parse_config(contents):
+    with create_temp_config_file(contents) as f:
+        return init_decider_parser(f)
+
+
+def with_bucket_val(config, bucket_val):
+    config = deepcopy(config)
+    config["exp_1"]["experiment"]["bucket_val"] = bucket_val
+    return config
 
 
-def setup_decider(file_name, decider_context, mock_span, event_logger):
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class CountingEventLogger(EventLogger):
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.log_count = 0
+        self.last_kwargs = None
+
+    def log(self, **kwargs):
+        self.log_count += 1
+        self.last_kwargs = kwargs
+
+
+class FakeSpan:
+    # the decider only reads a span's `context` & passes the span along with exposure events
+    def __init__(self, context=None):
+        self.context = context
+
+
+@contextlib.contextmanager
+def capture_logs(level=logging.INFO):
+    handler = RecordingHandler(level)
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(level)
     try:
-        rs_decider = init_decider_parser(file_name)
-    except Exception as e:
-        print(e)
-        rs_decider = None
-
-    return Decider(
-        decider_context=decider_context,
-        internal=rs_decider,
-        server_span=mock_span,
-        context_name="test",
-        event_logger=event_logger,
+        yield handler.records
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
+
+def make_object_failure_count(error_type):
+    return sum(
+        sample.value
+        for metric in experiments_client_counter.collect()
+        for sample in metric.samples
+        if sample.name == "experiments_py_client_total"
+        and sample.labels["operation"] == "make_object_for_context"
+        and sample.labels["success"] == "false"
+        and sample.labels["error_type"] == error_type
     )
 
 
-def first_occurrence_of_key_in(array, dict_key, name):
-    return next((v for v in array if v[dict_key] == name), None)
+def index_by_key(array, dict_key):
+    # keyed by first occurrence so lookups match a linear scan of `array`
+    index = {}
+    for v in array:
+        index.setdefault(v[dict_key], v)
+    return index
 
 
-@mock.patch("reddit_decider.FileWatcher")
 class DeciderClientFromConfigTests(unittest.TestCase):
+    # `FileWatcher` is mocked out, so the path is never opened
+    CONFIG_PATH = "/var/local/test_experiments.json"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.event_logger = CountingEventLogger()
+        cls.file_watcher_patcher = mock.patch("reddit_decider.FileWatcher")
+        cls.file_watcher_mock = cls.file_watcher_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.file_watcher_patcher.stop()
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
-        self.event_logger = mock.Mock(spec=DebugLogger)
-        self.mock_span = mock.MagicMock(spec=ServerSpan)
+        self.file_watcher_mock.reset_mock()
+        self.event_logger.reset()
 
-    def test_make_client_without_timeout_set(self, file_watcher_mock):
-        with create_temp_config_file({}) as f:
-            decider_ctx_factory = decider_client_from_config(
-                {"experiments.path": f.name}, self.event_logger
-            )
+    def test_make_client_without_timeout_set(self):
+        decider_ctx_factory = decider_client_from_config(
+            {"experiments.path": self.CONFIG_PATH}, self.event_logger
+        )
         self.assertIsInstance(decider_ctx_factory, DeciderContextFactory)
-        file_watcher_mock.assert_called_once_with(
-            path=f.name, parser=init_decider_parser, timeout=30.0, backoff=None
+        self.file_watcher_mock.assert_called_once_with(
+            path=self.CONFIG_PATH, parser=init_decider_parser, timeout=30.0, backoff=None
         )
 
-    def test_timeout(self, file_watcher_mock):
-        with create_temp_config_file({}) as f:
-            decider_ctx_factory = decider_client_from_config(
-                {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
-                self.event_logger,
-            )
+    def test_timeout(self):
+        decider_ctx_factory = decider_client_from_config(
+            {"experiments.path": self.CONFIG_PATH, "experiments.timeout": "2 seconds"},
+            self.event_logger,
+        )
         self.assertIsInstance(decider_ctx_factory, DeciderContextFactory)
-        file_watcher_mock.assert_called_once_with(
-            path=f.name, parser=init_decider_parser, timeout=2.0, backoff=None
+        self.file_watcher_mock.assert_called_once_with(
+            path=self.CONFIG_PATH, parser=init_decider_parser, timeout=2.0, backoff=None
         )
 
-    def test_prefix(self, file_watcher_mock):
-        with create_temp_config_file({}) as f:
-            decider_ctx_factory = decider_client_from_config(
-                {"r2_experiments.path": f.name, "r2_experiments.timeout": "2 seconds"},
-                self.event_logger,
-                prefix="r2_experiments.",
-            )
+    def test_prefix(self):
+        decider_ctx_factory = decider_client_from_config(
+            {"r2_experiments.path": self.CONFIG_PATH, "r2_experiments.timeout": "2 seconds"},
+            self.event_logger,
+            prefix="r2_experiments.",
+        )
         self.assertIsInstance(decider_ctx_factory, DeciderContextFactory)
-        file_watcher_mock.assert_called_once_with(
-            path=f.name, parser=init_decider_parser, timeout=2.0, backoff=None
+        self.file_watcher_mock.assert_called_once_with(
+            path=self.CONFIG_PATH, parser=init_decider_parser, timeout=2.0, backoff=None
         )
 
 
 class DeciderContextFactoryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.event_logger = CountingEventLogger()
+
+        cls.warning_handler = RecordingHandler(logging.WARN)
+        cls.logger_level = logger.level
+        logger.addHandler(cls.warning_handler)
+        logger.setLevel(logging.WARN)
+
+        # tests only read from the edge context, so it is built once from plain namespaces; a
+        # test that needs a different edge context replaces it on its own `mock_span.context`.
+        # `authentication_token` stays a mock since it must pass an `isinstance()` check
+        authentication_token = mock.Mock(spec=ValidatedAuthenticationToken)
+        authentication_token.oauth_client_id = AUTH_CLIENT_ID
+        authentication_token.loid_created_ms = LOID_CREATED_TIMESTAMP
+        cls.edge_context = SimpleNamespace(
+            user=SimpleNamespace(
+                event_fields=lambda: EVENT_FIELDS,
+                is_logged_in=IS_LOGGED_IN,
+                has_role=lambda role: role == "employee",
+            ),
+            authentication_token=authentication_token,
+            geolocation=SimpleNamespace(country_code=COUNTRY_CODE),
+            locale=SimpleNamespace(locale_code=LOCALE_CODE),
+            origin_service=SimpleNamespace(name=ORIGIN_SERVICE),
+            device=SimpleNamespace(id=DEVICE_ID),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.removeHandler(cls.warning_handler)
+        logger.setLevel(cls.logger_level)
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
 
-        self.event_logger = mock.Mock(spec=DebugLogger)
-        self.mock_span = mock.MagicMock(spec=ServerSpan)
-        self.mock_span.context = mock.Mock()
-        self.mock_span.context.edge_context.user.event_fields = mock.Mock(return_value=EVENT_FIELDS)
-        self.mock_span.context.edge_context.authentication_token = mock.Mock(
-            spec=ValidatedAuthenticationToken
-        )
-        self.mock_span.context.edge_context.authentication_token.oauth_client_id = AUTH_CLIENT_ID
-        self.mock_span.context.edge_context.authentication_token.loid_created_ms = (
-            LOID_CREATED_TIMESTAMP
-        )
-        self.mock_span.context.edge_context.geolocation.country_code = COUNTRY_CODE
-        self.mock_span.context.edge_context.locale.locale_code = LOCALE_CODE
-        self.mock_span.context.edge_context.origin_service.name = ORIGIN_SERVICE
-        self.mock_span.context.edge_context.device.id = DEVICE_ID
+        self.warning_handler.records.clear()
+        self.event_logger.reset()
+        self.mock_span = FakeSpan(context=SimpleNamespace(edge_context=self.edge_context))
 
     def test_make_object_for_context_and_decider_context(self):
         with create_temp_config_file({}) as f:
@@ -149,77 +261,79 @@ class DeciderContextFactoryTests(unittest.TestCase):
                 prefix="experiments.",
                 request_field_extractor=decider_field_extractor,
             )
-        with self.assertLogs(logger, logging.WARN) as captured:
-            # ensure no warnings are printed except for the dummy one
-            # https://stackoverflow.com/a/61381576/4260179
-            logger.warning("Dummy warning")
-            decider = decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
-            assert len(captured.records) == 1
-            self.assertEqual(["WARNING:root:Dummy warning"], captured.output)
+        decider = decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
+        # ensure no warnings are logged
+        self.assertEqual(self.warning_handler.records, [])
 
         self.assertIsInstance(decider, Decider)
 
         decider_context = getattr(decider, "_decider_context")
         self.assertIsInstance(decider_context, DeciderContext)
 
+        cookie_created_timestamp = self.mock_span.context.edge_context.user.event_fields().get(
+            "cookie_created_timestamp"
+        )
+
         decider_ctx_dict = decider_context.to_dict()
-        self.assertEqual(decider_ctx_dict["user_id"], USER_ID)
-        self.assertEqual(decider_ctx_dict["country_code"], COUNTRY_CODE)
-        self.assertEqual(decider_ctx_dict["user_is_employee"], True)
-        self.assertEqual(decider_ctx_dict["logged_in"], IS_LOGGED_IN)
-        self.assertEqual(decider_ctx_dict["device_id"], DEVICE_ID)
-        self.assertEqual(decider_ctx_dict["locale"], LOCALE_CODE)
-        self.assertEqual(decider_ctx_dict["origin_service"], ORIGIN_SERVICE)
-        self.assertEqual(decider_ctx_dict["oauth_client_id"], AUTH_CLIENT_ID)
+        expected_ctx = {
+            "user_id": USER_ID,
+            "country_code": COUNTRY_CODE,
+            "user_is_employee": True,
+            "logged_in": IS_LOGGED_IN,
+            "device_id": DEVICE_ID,
+            "locale": LOCALE_CODE,
+            "origin_service": ORIGIN_SERVICE,
+            "oauth_client_id": AUTH_CLIENT_ID,
+            "cookie_created_timestamp": cookie_created_timestamp,
+            "loid_created_timestamp": LOID_CREATED_TIMESTAMP,
+            **EXTRACTED_FIELDS,
+        }
+        self.assertEqual({k: decider_ctx_dict[k] for k in expected_ctx}, expected_ctx)
         self.assertEqual(
-            decider_ctx_dict["cookie_created_timestamp"],
-            self.mock_span.context.edge_context.user.event_fields().get("cookie_created_timestamp"),
+            {k: decider_ctx_dict["other_fields"][k] for k in EXTRACTED_FIELDS}, EXTRACTED_FIELDS
         )
-        self.assertEqual(decider_ctx_dict["loid_created_timestamp"], LOID_CREATED_TIMESTAMP)
-        self.assertEqual(decider_ctx_dict["app_name"], APP_NAME)
-        self.assertEqual(decider_ctx_dict["other_fields"]["app_name"], APP_NAME)
-        self.assertEqual(decider_ctx_dict["app_version"], APP_VERSION)
-        self.assertEqual(decider_ctx_dict["other_fields"]["app_version"], APP_VERSION)
-        self.assertEqual(decider_ctx_dict["build_number"], BUILD_NUMBER)
-        self.assertEqual(decider_ctx_dict["other_fields"]["build_number"], BUILD_NUMBER)
-        self.assertEqual(decider_ctx_dict["canonical_url"], CANONICAL_URL)
-        self.assertEqual(decider_ctx_dict["other_fields"]["canonical_url"], CANONICAL_URL)
 
         decider_event_dict = decider_context.to_event_dict()
-        self.assertEqual(decider_event_dict["user_id"], USER_ID)
-        self.assertEqual(decider_event_dict["user"]["id"], USER_ID)
-        self.assertEqual(decider_event_dict["country_code"], COUNTRY_CODE)
-        self.assertEqual(decider_event_dict["geo"]["country_code"], COUNTRY_CODE)
-        self.assertEqual(decider_event_dict["user_is_employee"], True)
-        self.assertEqual(decider_event_dict["user"]["is_employee"], True)
-        self.assertEqual(decider_event_dict["logged_in"], IS_LOGGED_IN)
-        self.assertEqual(decider_event_dict["user"]["logged_in"], IS_LOGGED_IN)
-
-        self.assertEqual(decider_event_dict["device_id"], DEVICE_ID)
-        self.assertEqual(decider_event_dict["platform"]["device_id"], DEVICE_ID)
-        self.assertEqual(decider_event_dict["locale"], LOCALE_CODE)
-        self.assertEqual(decider_event_dict["app"]["relevant_locale"], LOCALE_CODE)
-        self.assertEqual(decider_event_dict["origin_service"], ORIGIN_SERVICE)
-        self.assertEqual(decider_event_dict.get("oauth_client_id"), None)
-        self.assertEqual(
-            decider_event_dict["cookie_created_timestamp"],
-            self.mock_span.context.edge_context.user.event_fields().get("cookie_created_timestamp"),
-        )
+        expected_event = {
+            "user_id": USER_ID,
+            "country_code": COUNTRY_CODE,
+            "user_is_employee": True,
+            "logged_in": IS_LOGGED_IN,
+            "device_id": DEVICE_ID,
+            "locale": LOCALE_CODE,
+            "origin_service": ORIGIN_SERVICE,
+            "oauth_client_id": None,
+            "cookie_created_timestamp": cookie_created_timestamp,
+            **EXTRACTED_FIELDS,
+        }
+        self.assertEqual({k: decider_event_dict.get(k) for k in expected_event}, expected_event)
+
+        expected_event_sections = {
+            "user": {
+                "id": USER_ID,
+                "is_employee": True,
+                "logged_in": IS_LOGGED_IN,
+                "cookie_created_timestamp": cookie_created_timestamp,
+            },
+            "geo": {"country_code": COUNTRY_CODE},
+            "platform": {"device_id": DEVICE_ID},
+            "app": {
+                "relevant_locale": LOCALE_CODE,
+                "name": APP_NAME,
+                "version": APP_VERSION,
+                "build_number": BUILD_NUMBER,
+            },
+            "request": {"canonical_url": CANONICAL_URL},
+        }
         self.assertEqual(
-            decider_event_dict["user"]["cookie_created_timestamp"],
-            self.mock_span.context.edge_context.user.event_fields().get("cookie_created_timestamp"),
+            {
+                section: {k: decider_event_dict[section][k] for k in fields}
+                for section, fields in expected_event_sections.items()
+            },
+            expected_event_sections,
         )
-        self.assertEqual(decider_event_dict["app_name"], APP_NAME)
-        self.assertEqual(decider_event_dict["app"]["name"], APP_NAME)
-        self.assertEqual(decider_event_dict["app_version"], APP_VERSION)
-        self.assertEqual(decider_event_dict["app"]["version"], APP_VERSION)
-        self.assertEqual(decider_event_dict["build_number"], BUILD_NUMBER)
-        self.assertEqual(decider_event_dict["app"]["build_number"], BUILD_NUMBER)
-        self.assertEqual(decider_event_dict["canonical_url"], CANONICAL_URL)
-        self.assertEqual(decider_event_dict["request"]["canonical_url"], CANONICAL_URL)
-
-    @mock.patch("reddit_decider.experiments_client_counter.labels")
-    def test_make_object_for_context_without_span(self, metric_counter_labels):
+
+    def test_make_object_for_context_reads_changed_manifest(self):
         with create_temp_config_file({}) as f:
             decider_ctx_factory = decider_client_from_config(
                 {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
@@ -227,29 +341,39 @@ class DeciderContextFactoryTests(unittest.TestCase):
                 prefix="experiments.",
                 request_field_extractor=decider_field_extractor,
             )
-        with self.assertLogs(logger, logging.WARN) as captured:
-            # ensure no warnings are printed except for the dummy one
-            # https://stackoverflow.com/a/61381576/4260179
-            logger.warning("Dummy warning")
-
-            decider = decider_ctx_factory.make_object_for_context(name="test", span=None)
-            assert len(captured.records) == 1
-            self.assertEqual(["WARNING:root:Dummy warning"], captured.output)
-
-            metric_counter_labels.assert_called_once_with(
-                operation="make_object_for_context",
-                success="false",
-                error_type="missing:'span'",
-                pkg_version=mock.ANY,
+            decider = decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
+            self.assertIsNone(decider.get_experiment("exp_1"))
+
+            with open(f.name, "w") as manifest:
+                json.dump(TestDeciderGetVariantAndExpose.EXP_BASE_CONFIG, manifest)
+            # make sure the rewrite is seen as a change even on coarse mtime resolution
+            stat = os.stat(f.name)
+            os.utime(f.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            # the next request picks up the changed manifest
+            decider = decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
+            self.assertEqual(decider.get_experiment("exp_1").name, "exp_1")
+
+    def test_make_object_for_context_without_span(self):
+        with create_temp_config_file({}) as f:
+            decider_ctx_factory = decider_client_from_config(
+                {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
+                self.event_logger,
+                prefix="experiments.",
+                request_field_extractor=decider_field_extractor,
             )
+        failure_count = make_object_failure_count("missing:'span'")
+        decider = decider_ctx_factory.make_object_for_context(name="test", span=None)
+        # ensure no warnings are logged
+        self.assertEqual(self.warning_handler.records, [])
+        self.assertEqual(make_object_failure_count("missing:'span'") - failure_count, 1)
 
         self.assertIsInstance(decider, Decider)
 
         decider_ctx_dict = decider._decider_context.to_dict()
         self.assertEqual(decider_ctx_dict["user_id"], None)
 
-    @mock.patch("reddit_decider.experiments_client_counter.labels")
-    def test_make_object_for_context_with_span_context_as_None(self, metric_counter_labels):
+    def test_make_object_for_context_with_span_context_as_None(self):
         with create_temp_config_file({}) as f:
             decider_ctx_factory = decider_client_from_config(
                 {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
@@ -258,29 +382,69 @@ class DeciderContextFactoryTests(unittest.TestCase):
                 request_field_extractor=decider_field_extractor,
             )
 
-        mock_span = mock.MagicMock(spec=ServerSpan)
+        failure_count = make_object_failure_count("missing:'span.context'")
         # span is missing context
+        decider = decider_ctx_factory.make_object_for_context(name="test", span=FakeSpan())
+        # ensure no warnings are logged
+        self.assertEqual(self.warning_handler.records, [])
+        self.assertEqual(make_object_failure_count("missing:'span.context'") - failure_count, 1)
 
-        with self.assertLogs(logger, logging.WARN) as captured:
-            # ensure no warnings are printed except for the dummy one
-            # https://stackoverflow.com/a/61381576/4260179
-            logger.warning("Dummy warning")
+        self.assertIsInstance(decider, Decider)
 
-            decider = decider_ctx_factory.make_object_for_context(name="test", span=mock_span)
-            assert len(captured.records) == 1
-            self.assertEqual(["WARNING:root:Dummy warning"], captured.output)
+        decider_ctx_dict = decider._decider_context.to_dict()
+        self.assertEqual(decider_ctx_dict["user_id"], None)
 
-            metric_counter_labels.assert_called_once_with(
-                operation="make_object_for_context",
-                success="false",
-                error_type="missing:'span.context'",
-                pkg_version=mock.ANY,
+    def test_make_object_for_context_with_inaccessible_edge_context_fields(self):
+        with create_temp_config_file({}) as f:
+            decider_ctx_factory = decider_client_from_config(
+                {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
+                self.event_logger,
+                prefix="experiments.",
+                request_field_extractor=decider_field_extractor,
             )
 
-        self.assertIsInstance(decider, Decider)
+        for case, edge_context in (
+            # every `edge_context` attribute access raises `AttributeError`
+            ("inaccessible", SimpleNamespace()),
+            # `event_fields()` succeeds but yields no values & everything else raises
+            ("empty", SimpleNamespace(user=SimpleNamespace(event_fields=lambda: {}))),
+        ):
+            with self.subTest(case=case):
+                self.mock_span.context.edge_context = edge_context
 
-        decider_ctx_dict = decider._decider_context.to_dict()
-        self.assertEqual(decider_ctx_dict["user_id"], None)
+                decider = decider_ctx_factory.make_object_for_context(
+                    name="test", span=self.mock_span
+                )
+                self.assertIsInstance(decider, Decider)
+
+                decider_ctx_dict = decider._decider_context.to_dict()
+                self.assertEqual(decider_ctx_dict["user_id"], None)
+                self.assertEqual(decider_ctx_dict["country_code"], None)
+                self.assertEqual(decider_ctx_dict["user_is_employee"], None)
+                self.assertEqual(decider_ctx_dict["app_name"], APP_NAME)
+                self.assertEqual(decider_ctx_dict["canonical_url"], CANONICAL_URL)
+
+    def test_make_object_for_context_with_failing_decider_context_init(self):
+        with create_temp_config_file({}) as f:
+            decider_ctx_factory = decider_client_from_config(
+                {"experiments.path": f.name, "experiments.timeout": "2 seconds"},
+                self.event_logger,
+                prefix="experiments.",
+                request_field_extractor=decider_field_extractor,
+            )
+
+        failure_count = make_object_failure_count("DeciderContext_init_failed")
+        # the full `DeciderContext(...)` raises, the empty fallback one doesn't
+        with mock.patch(
+            "reddit_decider.DeciderContext", side_effect=[TypeError("boom"), DeciderContext()]
+        ):
+            decider = decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
+
+        self.assertIsInstance(decider, Decider)
+        self.assertEqual(decider._decider_context.to_dict()["user_id"], None)
+        self.assertEqual(make_object_failure_count("DeciderContext_init_failed") - failure_count, 1)
+        messages = "\n".join(x.getMessage() for x in self.warning_handler.records)
+        assert "Could not create full DeciderContext()" in messages
 
     def test_make_object_for_context_and_decider_context_with_malformed_decider_field_extractor(
         self,
@@ -302,31 +466,26 @@ class DeciderContextFactoryTests(unittest.TestCase):
                 request_field_extractor=decider_field_extractor_with_malformed_fields,
             )
 
-        with self.assertLogs() as captured:
+        with capture_logs() as records:
             decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
 
-            assert len(captured.records) == 3
+            assert len(records) == 3
 
-            assert any(
+            messages = "\n".join(x.getMessage() for x in records)
+            assert (
                 "None key in request_field_extractor() dict is not of type str and is removed."
-                in x.getMessage()
-                for x in captured.records
+                in messages
             )
-            assert any(
+            assert (
                 "True key in request_field_extractor() dict is not of type str and is removed."
-                in x.getMessage()
-                for x in captured.records
+                in messages
             )
-            assert any(
+            assert (
                 "app_name: {} value in `request_field_extractor()` dict is not one of type: [None, int, float, str, bool] and is removed."
-                in x.getMessage()
-                for x in captured.records
+                in messages
             )
 
-    @mock.patch("reddit_decider.experiments_client_counter.labels")
-    def test_make_object_for_context_with_broken_decider_field_extractor_raises_exception(
-        self, metric_counter_labels
-    ):
+    def test_make_object_for_context_with_broken_decider_field_extractor_raises_exception(self):
         class SomeException(Exception):
             pass
 
@@ -341,6 +500,7 @@ class DeciderContextFactoryTests(unittest.TestCase):
                 request_field_extractor=broken_decider_field_extractor,
             )
 
+        failure_count = make_object_failure_count("request_field_extractor")
         with self.assertRaises(SomeException) as e:
             decider_ctx_factory.make_object_for_context(name="test", span=self.mock_span)
 
@@ -349,12 +509,7 @@ class DeciderContextFactoryTests(unittest.TestCase):
             "bad extractor",
         )
 
-        metric_counter_labels.assert_called_once_with(
-            operation="make_object_for_context",
-            success="false",
-            error_type="request_field_extractor",
-            pkg_version=mock.ANY,
-        )
+        self.assertEqual(make_object_failure_count("request_field_extractor") - failure_count, 1)
 
 
 # Todo: test DeciderClient()
@@ -362,121 +517,181 @@ class DeciderContextFactoryTests(unittest.TestCase):
 # class DeciderClientTests(unittest.TestCase):
 
 
-class TestDeciderGetVariantAndExpose(unittest.TestCase):
+class DeciderTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.event_logger = CountingEventLogger()
+
     def setUp(self):
         super().setUp()
-        self.event_logger = mock.Mock(spec=DebugLogger)
-        self.mock_span = mock.MagicMock(spec=ServerSpan)
-        self.mock_span.context = None
-        self.minimal_decider_context = DeciderContext()
-        self.exp_base_config = {
-            "exp_1": {
-                "id": 1,
-                "name": "exp_1",
-                "enabled": True,
-                "version": "2",
-                "type": "range_variant",
-                "emit_event": True,
-                "start_ts": 37173982,
-                "stop_ts": 2147483648,
-                "owner": "test_owner",
-                "experiment": {
-                    "variants": [
-                        {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
-                        {"range_start": 0.2, "range_end": 0.4, "name": "control_2"},
-                        {"range_start": 0.4, "range_end": 0.6, "name": "variant_2"},
-                        {"range_start": 0.6, "range_end": 0.8, "name": "variant_3"},
-                        {"range_start": 0.8, "range_end": 1.0, "name": "variant_4"},
-                    ],
-                    "experiment_version": 2,
-                    "shuffle_version": 0,
-                    "bucket_val": "user_id",
-                    "log_bucketing": False,
-                },
-            }
+        self.event_logger.reset()
+        self.mock_span = FakeSpan()
+
+    def make_decider(self, rs_decider, decider_context=None):
+        return Decider(
+            decider_context=self.dc if decider_context is None else decider_context,
+            internal=rs_decider,
+            server_span=self.mock_span,
+            context_name="test",
+            event_logger=self.event_logger,
+        )
+
+    def setup_decider(self, config, decider_context=None):
+        try:
+            rs_decider = parse_config(config)
+        except Exception as e:
+            print(e)
+            rs_decider = None
+
+        return self.make_decider(rs_decider, decider_context)
+
+
+class TestDeciderGetVariantAndExpose(DeciderTestCase):
+    EXP_BASE_CONFIG = {
+        "exp_1": {
+            "id": 1,
+            "name": "exp_1",
+            "enabled": True,
+            "version": "2",
+            "type": "range_variant",
+            "emit_event": True,
+            "start_ts": 37173982,
+            "stop_ts": 2147483648,
+            "owner": "test_owner",
+            "experiment": {
+                "variants": [
+                    {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
+                    {"range_start": 0.2, "range_end": 0.4, "name": "control_2"},
+                    {"range_start": 0.4, "range_end": 0.6, "name": "variant_2"},
+                    {"range_start": 0.6, "range_end": 0.8, "name": "variant_3"},
+                    {"range_start": 0.8, "range_end": 1.0, "name": "variant_4"},
+                ],
+                "experiment_version": 2,
+                "shuffle_version": 0,
+                "bucket_val": "user_id",
+                "log_bucketing": False,
+            },
         }
+    }
 
-        self.parent_hg_config = {
-            "hg": {
-                "enabled": True,
-                "version": "5",
-                "type": "range_variant",
-                "emit_event": True,
-                "experiment": {
-                    "variants": [
-                        {"name": "holdout", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
-                        {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
-                    ],
-                    "experiment_version": 5,
-                    "shuffle_version": 0,
-                    "bucket_val": "user_id",
-                    "log_bucketing": False,
-                },
-                "start_ts": 0,
-                "stop_ts": 9668199193,
-                "id": 2,
-                "name": "hg",
-                "owner": "test",
-                "value": "range_variant",
-            }
+    PARENT_HG_CONFIG = {
+        "hg": {
+            "enabled": True,
+            "version": "5",
+            "type": "range_variant",
+            "emit_event": True,
+            "experiment": {
+                "variants": [
+                    {"name": "holdout", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
+                    {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
+                ],
+                "experiment_version": 5,
+                "shuffle_version": 0,
+                "bucket_val": "user_id",
+                "log_bucketing": False,
+            },
+            "start_ts": 0,
+            "stop_ts": 9668199193,
+            "id": 2,
+            "name": "hg",
+            "owner": "test",
+            "value": "range_variant",
         }
+    }
 
-        self.additional_two_exp = {
-            "e1": {
-                "enabled": True,
-                "version": "4",
-                "type": "range_variant",
-                "owner": "test",
-                "emit_event": True,
-                "experiment": {
-                    "variants": [
-                        {"name": "e1treat", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
-                        {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
-                    ],
-                    "experiment_version": 4,
-                    "shuffle_version": 0,
-                    "bucket_val": "user_id",
-                },
-                "start_ts": 0,
-                "stop_ts": 9668199193,
-                "id": 6,
-                "name": "e1",
+    ADDITIONAL_TWO_EXP = {
+        "e1": {
+            "enabled": True,
+            "version": "4",
+            "type": "range_variant",
+            "owner": "test",
+            "emit_event": True,
+            "experiment": {
+                "variants": [
+                    {"name": "e1treat", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
+                    {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
+                ],
+                "experiment_version": 4,
+                "shuffle_version": 0,
+                "bucket_val": "user_id",
             },
-            "e2": {
-                "enabled": True,
-                "version": "5",
-                "type": "range_variant",
-                "owner": "test",
-                "emit_event": True,
-                "experiment": {
-                    "variants": [
-                        {"name": "e2treat", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
-                        {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
-                    ],
-                    "experiment_version": 5,
-                    "shuffle_version": 0,
-                    "bucket_val": "user_id",
-                },
-                "start_ts": 0,
-                "stop_ts": 9668199193,
-                "id": 7,
-                "name": "e2",
+            "start_ts": 0,
+            "stop_ts": 9668199193,
+            "id": 6,
+            "name": "e1",
+        },
+        "e2": {
+            "enabled": True,
+            "version": "5",
+            "type": "range_variant",
+            "owner": "test",
+            "emit_event": True,
+            "experiment": {
+                "variants": [
+                    {"name": "e2treat", "size": 1.0, "range_end": 1.0, "range_start": 0.0},
+                    {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
+                ],
+                "experiment_version": 5,
+                "shuffle_version": 0,
+                "bucket_val": "user_id",
             },
+            "start_ts": 0,
+            "stop_ts": 9668199193,
+            "id": 7,
+            "name": "e2",
+        },
+    }
+
+    # exposure fields that are the same for every experiment, variant & identifier
+    EXPECTED_EXPOSURE_FIELDS = {
+        "logged_in": IS_LOGGED_IN,
+        "app_name": APP_NAME,
+        "build_number": BUILD_NUMBER,
+        "app_version": APP_VERSION,
+        "canonical_url": CANONICAL_URL,
+        "cookie_created_timestamp": COOKIE_CREATED_TIMESTAMP,
+        "event_type": EventType.EXPOSE,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # `DeciderContext`s are only read by the tests, so they are shared
+        cls.minimal_decider_context = DeciderContext()
+        cls.dc = DeciderContext(**DECIDER_CONTEXT_FIELDS, extracted_fields=EXTRACTED_FIELDS)
+
+        # tests that leave `exp_base_config` unmodified apart from `exp_1`'s "bucket_val"
+        # share these parsed manifests
+        cls.base_rs_deciders = {
+            bucket_val: parse_config(with_bucket_val(cls.EXP_BASE_CONFIG, bucket_val))
+            for bucket_val in (
+                "user_id",
+                "device_id",
+                "canonical_url",
+                "subreddit_id",
+                "ad_account_id",
+                "business_id",
+            )
         }
 
-        self.dc = DeciderContext(
-            user_id=USER_ID,
-            logged_in=IS_LOGGED_IN,
-            country_code=COUNTRY_CODE,
-            locale=LOCALE_CODE,
-            origin_service=ORIGIN_SERVICE,
-            user_is_employee=True,
-            device_id=DEVICE_ID,
-            oauth_client_id=AUTH_CLIENT_ID,
-            cookie_created_timestamp=COOKIE_CREATED_TIMESTAMP,
-            loid_created_timestamp=LOID_CREATED_TIMESTAMP,
-            extracted_fields=decider_field_extractor(_request=None),
-        )
+        # base manifest combined with a parent "hg" and/or 2 more experiments;
+        # nested dicts are shared with the class constants, so tests deepcopy before mutating
+        exp_1_with_hg = {"exp_1": {**cls.EXP_BASE_CONFIG["exp_1"], "parent_hg_name": "hg"}}
+        cls.EXP_BASE_HG_CONFIG = {**exp_1_with_hg, **cls.PARENT_HG_CONFIG}
+        cls.EXP_BASE_TWO_CONFIG = {**cls.EXP_BASE_CONFIG, **cls.ADDITIONAL_TWO_EXP}
+        cls.EXP_BASE_HG_TWO_CONFIG = {
+            **exp_1_with_hg,
+            **cls.PARENT_HG_CONFIG,
+            **cls.ADDITIONAL_TWO_EXP,
+        }
+
+    def setUp(self):
+        super().setUp()
+        self.exp_base_config = deepcopy(self.EXP_BASE_CONFIG)
+
+    def setup_base_decider(self, decider_context=None, bucket_val="user_id"):
+        return self.make_decider(self.base_rs_deciders[bucket_val], decider_context)
 
     def assert_exposure_event_fields(
         self,
@@ -486,23 +701,13 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
         bucket_val: str = "user_id",
         identifier: str = USER_ID,
     ):
-        self.assertEqual(event_fields["variant"], variant)
-        self.assertEqual(event_fields[bucket_val], identifier)
-        self.assertEqual(event_fields["logged_in"], IS_LOGGED_IN)
-        self.assertEqual(event_fields["app_name"], APP_NAME)
-        self.assertEqual(event_fields["build_number"], BUILD_NUMBER)
-        self.assertEqual(event_fields["app_version"], APP_VERSION)
-        self.assertEqual(event_fields["canonical_url"], CANONICAL_URL)
-        self.assertEqual(event_fields["cookie_created_timestamp"], COOKIE_CREATED_TIMESTAMP)
-        self.assertEqual(event_fields["event_type"], EventType.EXPOSE)
-        self.assertNotEqual(event_fields["span"], None)
-
-        cfg = self.exp_base_config[experiment_name]
-        self.assertEqual(getattr(event_fields["experiment"], "id"), cfg["id"])
-        self.assertEqual(getattr(event_fields["experiment"], "name"), cfg["name"])
-        self.assertEqual(getattr(event_fields["experiment"], "owner"), cfg["owner"])
-        self.assertEqual(getattr(event_fields["experiment"], "version"), cfg["version"])
-        self.assertEqual(getattr(event_fields["experiment"], "bucket_val"), bucket_val)
+        self.assert_minimal_exposure_event_fields(
+            experiment_name, variant, event_fields, bucket_val, identifier
+        )
+        self.assertEqual(
+            {k: event_fields[k] for k in self.EXPECTED_EXPOSURE_FIELDS},
+            self.EXPECTED_EXPOSURE_FIELDS,
+        )
 
     def assert_minimal_exposure_event_fields(
         self,
@@ -512,32 +717,31 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
         bucket_val: str = "user_id",
         identifier: str = USER_ID,
     ):
-        self.assertEqual(event_fields["variant"], variant)
-        self.assertEqual(event_fields[bucket_val], identifier)
-        self.assertEqual(event_fields["event_type"], EventType.EXPOSE)
+        self.assertEqual(
+            (event_fields["variant"], event_fields[bucket_val], event_fields["event_type"]),
+            (variant, identifier, EventType.EXPOSE),
+        )
         self.assertNotEqual(event_fields["span"], None)
 
+        exp = event_fields["experiment"]
         cfg = self.exp_base_config[experiment_name]
-        self.assertEqual(getattr(event_fields["experiment"], "id"), cfg["id"])
-        self.assertEqual(getattr(event_fields["experiment"], "name"), cfg["name"])
-        self.assertEqual(getattr(event_fields["experiment"], "owner"), cfg["owner"])
-        self.assertEqual(getattr(event_fields["experiment"], "version"), cfg["version"])
-        self.assertEqual(getattr(event_fields["experiment"], "bucket_val"), bucket_val)
+        self.assertEqual(
+            (exp.id, exp.name, exp.owner, exp.version, exp.bucket_val),
+            (cfg["id"], cfg["name"], cfg["owner"], cfg["version"], bucket_val),
+        )
 
     def test_get_variant(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_base_decider()
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant(experiment_name="exp_1")
-            self.assertEqual(variant, "variant_4")
+        variant = decider.get_variant(experiment_name="exp_1")
+        self.assertEqual(variant, "variant_4")
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_exposure_event_fields(
-                experiment_name="exp_1", variant=variant, event_fields=event_fields
-            )
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
+        self.assert_exposure_event_fields(
+            experiment_name="exp_1", variant=variant, event_fields=event_fields
+        )
 
     def test_none_returned_on_get_variant_call_with_bad_id(self):
         config = {
@@ -562,21 +766,19 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
                 },
             }
         }
-        with create_temp_config_file(config) as f:
-            with self.assertLogs() as captured:
-                decider = setup_decider(
-                    f, self.minimal_decider_context, self.mock_span, self.event_logger
-                )
-                variant = decider.get_variant("test")
+        with capture_logs(logging.WARNING) as records:
+            rs_decider = parse_config(config)
+            decider = self.make_decider(rs_decider, self.minimal_decider_context)
+            variant = decider.get_variant("test")
 
-                self.assertEqual(variant, None)
-                self.assertEqual(self.event_logger.log.call_count, 0)
+            self.assertEqual(variant, None)
+            self.assertEqual(self.event_logger.log_count, 0)
 
-                assert any(
-                    "Partially loaded Decider: 1 features failed to load: {'test': 'Manifest parsing error: invalid type: string \"1\", expected u32'}"
-                    in x.getMessage()
-                    for x in captured.records
-                )
+            messages = "\n".join(x.getMessage() for x in records)
+            assert (
+                "Partially loaded Decider: 1 features failed to load: {'test': 'Manifest parsing error: invalid type: string \"1\", expected u32'}"
+                in messages
+            )
 
     def test_none_returned_on_get_variant_call_with_no_experiment_data(self):
         config = {
@@ -590,14 +792,11 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
                 "stop_ts": 0,
             }
         }
-        with create_temp_config_file(config) as f:
-            decider = setup_decider(
-                f, self.minimal_decider_context, self.mock_span, self.event_logger
-            )
+        decider = self.setup_decider(config, self.minimal_decider_context)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant("test")
-            self.assertEqual(variant, None)
+        self.assertEqual(self.event_logger.log_count, 0)
+        variant = decider.get_variant("test")
+        self.assertEqual(variant, None)
 
     def test_get_variant_calls_with_partial_data(self):
         config = {
@@ -613,949 +812,566 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
         }
         self.exp_base_config.update(config)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        self.assertEqual(self.event_logger.log_count, 0)
 
-            # get_variant_for_identifier()
-            variant = decider.get_variant_for_identifier("test", USER_ID, "user_id")
-            self.assertEqual(variant, None)
+        # get_variant_for_identifier()
+        variant = decider.get_variant_for_identifier("test", USER_ID, "user_id")
+        self.assertEqual(variant, None)
 
-            variant = decider.get_variant_for_identifier("exp_1", USER_ID, "user_id")
-            self.assertEqual(variant, "variant_4")
+        variant = decider.get_variant_for_identifier("exp_1", USER_ID, "user_id")
+        self.assertEqual(variant, "variant_4")
 
-            # get_variant()
-            variant = decider.get_variant("test")
-            self.assertEqual(variant, None)
+        # get_variant()
+        variant = decider.get_variant("test")
+        self.assertEqual(variant, None)
+
+        variant = decider.get_variant("exp_1")
+        self.assertEqual(variant, "variant_4")
 
-            variant = decider.get_variant("exp_1")
+    def test_decider_context_dict_reused_across_calls(self):
+        decider = self.setup_base_decider()
+
+        with mock.patch.object(
+            DeciderContext, "to_dict", autospec=True, side_effect=DeciderContext.to_dict
+        ) as to_dict:
+            variant = decider.get_variant_without_expose(experiment_name="exp_1")
             self.assertEqual(variant, "variant_4")
 
-    def test_get_variant_without_expose(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+            # identifier override must not leak into the shared ctx
+            decider.get_variant_for_identifier_without_expose(
+                experiment_name="exp_1", identifier="t2_other", identifier_type="user_id"
+            )
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
             variant = decider.get_variant_without_expose(experiment_name="exp_1")
             self.assertEqual(variant, "variant_4")
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+            self.assertEqual(to_dict.call_count, 1)
 
-    def test_get_variant_without_expose_for_holdout_exposure(self):
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
+    def test_get_variant_without_expose(self):
+        decider = self.setup_base_decider()
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        variant = decider.get_variant_without_expose(experiment_name="exp_1")
+        self.assertEqual(variant, "variant_4")
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_without_expose(experiment_name="exp_1")
-            # user is part of Holdout (100% bucketing), so `None` is returned
-            self.assertEqual(variant, None)
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
+    def test_get_variant_without_expose_for_holdout_exposure(self):
+        self.exp_base_config = self.EXP_BASE_HG_CONFIG
 
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_exposure_event_fields(
-                experiment_name="hg", variant="holdout", event_fields=event_fields
-            )
+        decider = self.setup_decider(self.exp_base_config)
 
-    def test_get_variant_for_identifier_user_id(self):
-        identifier = USER_ID
-        bucket_val = "user_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+        variant = decider.get_variant_without_expose(experiment_name="exp_1")
+        # user is part of Holdout (100% bucketing), so `None` is returned
+        self.assertEqual(variant, None)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_4")
+        # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
+        self.assert_exposure_event_fields(
+            experiment_name="hg", variant="holdout", event_fields=event_fields
+        )
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                identifier=identifier,
-            )
+    def test_get_variant_for_identifier(self):
+        for identifier, bucket_val, expected_variant in (
+            (USER_ID, "user_id", "variant_4"),
+            (CANONICAL_URL, "canonical_url", "variant_3"),
+            (DEVICE_ID, "device_id", "variant_3"),
+            (SUBREDDIT_ID, "subreddit_id", "control_1"),
+            (AD_ACCOUNT_ID, "ad_account_id", "variant_2"),
+            (BUSINESS_ID, "business_id", "control_2"),
+        ):
+            with self.subTest(bucket_val=bucket_val):
+                self.event_logger.reset()
+                decider = self.setup_base_decider(bucket_val=bucket_val)
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["user_id"], identifier)
+                variant = decider.get_variant_for_identifier(
+                    experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
+                )
+                self.assertEqual(variant, expected_variant)
+
+                # exposure assertions
+                self.assertEqual(self.event_logger.log_count, 1)
+                event_fields = self.event_logger.last_kwargs
+                self.assert_exposure_event_fields(
+                    experiment_name="exp_1",
+                    variant=variant,
+                    event_fields=event_fields,
+                    bucket_val=bucket_val,
+                    identifier=identifier,
+                )
 
-    def test_get_variant_for_identifier_canonical_url(self):
-        identifier = CANONICAL_URL
-        bucket_val = "canonical_url"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+                # `identifier` passed to correct event field of experiment's `bucket_val` config
+                self.assertEqual(event_fields[bucket_val], identifier)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+    def test_get_variant_for_identifier_bogus_identifier_type(self):
+        identifier = "anything"
+        identifier_type = "blah"
+
+        decider = self.setup_base_decider(self.minimal_decider_context)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        with capture_logs(logging.WARNING) as records:
             variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
+                experiment_name="exp_1", identifier=identifier, identifier_type=identifier_type
             )
-            self.assertEqual(variant, "variant_3")
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
+
+            self.assertEqual(variant, None)
+
+            messages = "\n".join(x.getMessage() for x in records)
+            assert (
+                "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
+                in messages
             )
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["canonical_url"], identifier)
+        # exposure isn't emitted either
+        self.assertEqual(self.event_logger.log_count, 0)
 
-    def test_get_variant_for_identifier_device_id(self):
-        identifier = DEVICE_ID
-        bucket_val = "device_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+    def test_expose(self):
+        decider = self.setup_base_decider()
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        variant = "variant_4"
+        decider.expose("exp_1", variant)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_3")
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
+        self.assert_exposure_event_fields(
+            experiment_name="exp_1", variant=variant, event_fields=event_fields
+        )
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["device_id"], identifier)
+    def test_feature_rollout_does_not_expose(self):
+        self.exp_base_config["exp_1"].update({"emit_event": False})
 
-    def test_get_variant_for_identifier_subreddit_id(self):
-        identifier = SUBREDDIT_ID
-        bucket_val = "subreddit_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+        decider = self.setup_decider(self.exp_base_config)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        variant = "variant_4"
+        decider.expose("exp_1", variant)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "control_1")
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+        # exposure not fired
+        self.assertEqual(self.event_logger.log_count, 0)
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["subreddit_id"], identifier)
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+    def test_expose_without_variant_name(self):
+        decider = self.setup_base_decider()
+
+        decider.expose("exp_1", None)
+
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 0)
+
+    def test_get_variant_for_identifier_without_expose(self):
+        for identifier, bucket_val, expected_variant in (
+            (USER_ID, "user_id", "variant_4"),
+            (CANONICAL_URL, "canonical_url", "variant_3"),
+            (DEVICE_ID, "device_id", "variant_3"),
+            (SUBREDDIT_ID, "subreddit_id", "control_1"),
+            (AD_ACCOUNT_ID, "ad_account_id", "variant_2"),
+            (BUSINESS_ID, "business_id", "control_2"),
+        ):
+            with self.subTest(bucket_val=bucket_val):
+                self.event_logger.reset()
+                decider = self.setup_base_decider(bucket_val=bucket_val)
 
-    def test_get_variant_for_identifier_ad_account_id(self):
-        identifier = AD_ACCOUNT_ID
-        bucket_val = "ad_account_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+                variant = decider.get_variant_for_identifier_without_expose(
+                    experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
+                )
+                self.assertEqual(variant, expected_variant)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+                # no exposures should be triggered
+                self.assertEqual(self.event_logger.log_count, 0)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_2")
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+    def test_get_variant_for_identifier_without_expose_user_id_for_holdout_exposure(self):
+        identifier = USER_ID
+        bucket_val = "user_id"
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["ad_account_id"], identifier)
+        self.exp_base_config = self.EXP_BASE_HG_CONFIG
 
-    def test_get_variant_for_identifier_business_id(self):
-        identifier = BUSINESS_ID
-        bucket_val = "business_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
+        decider = self.setup_decider(self.exp_base_config)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        variant = decider.get_variant_for_identifier_without_expose(
+            experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
+        )
+        # user is part of Holdout (100% bucketing), so `None` is returned
+        self.assertEqual(variant, None)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "control_2")
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="exp_1",
-                variant=variant,
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
 
-            # `identifier` passed to correct event field of experiment's `bucket_val` config
-            self.assertEqual(event_fields["business_id"], identifier)
+        # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
+        self.assert_minimal_exposure_event_fields(
+            experiment_name="hg", variant="holdout", event_fields=event_fields
+        )
 
-    def test_get_variant_for_identifier_bogus_identifier_type(self):
+    def test_get_variant_for_identifier_without_expose_bogus_identifier_type(self):
         identifier = "anything"
         identifier_type = "blah"
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(
-                f, self.minimal_decider_context, self.mock_span, self.event_logger
+        decider = self.setup_base_decider()
+
+        with capture_logs(logging.WARNING) as records:
+            variant = decider.get_variant_for_identifier_without_expose(
+                experiment_name="exp_1", identifier=identifier, identifier_type=identifier_type
             )
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            with self.assertLogs() as captured:
-                variant = decider.get_variant_for_identifier(
-                    experiment_name="exp_1", identifier=identifier, identifier_type=identifier_type
-                )
+            self.assertEqual(variant, None)
 
-                self.assertEqual(variant, None)
+            messages = "\n".join(x.getMessage() for x in records)
+            assert (
+                "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
+                in messages
+            )
 
-                assert any(
-                    "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
-                    in x.getMessage()
-                    for x in captured.records
-                )
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
-        # exposure isn't emitted either
-        self.assertEqual(self.event_logger.log.call_count, 0)
+    def test_get_all_variants_without_expose(self):
+        # add 2 more experiments
+        self.exp_base_config = self.EXP_BASE_TWO_CONFIG
 
-    def test_expose(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = "variant_4"
-            decider.expose("exp_1", variant)
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_exposure_event_fields(
-                experiment_name="exp_1", variant=variant, event_fields=event_fields
-            )
+        decider = self.setup_decider(self.exp_base_config)
 
-    def test_feature_rollout_does_not_expose(self):
-        self.exp_base_config["exp_1"].update({"emit_event": False})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = "variant_4"
-            decider.expose("exp_1", variant)
-
-            # exposure not fired
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_expose_without_variant_name(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f.name, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-            decider.expose("exp_1", None)
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_user_id(self):
-        identifier = USER_ID
-        bucket_val = "user_id"
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_4")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_user_id_for_holdout_exposure(self):
-        identifier = USER_ID
-        bucket_val = "user_id"
-
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        variant_arr = decider.get_all_variants_without_expose()
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            # user is part of Holdout (100% bucketing), so `None` is returned
-            self.assertEqual(variant, None)
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="hg", variant="holdout", event_fields=event_fields
-            )
-
-    def test_get_variant_for_identifier_without_expose_canonical_url(self):
-        identifier = CANONICAL_URL
-        bucket_val = "canonical_url"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type="canonical_url"
-            )
-            self.assertEqual(variant, "variant_3")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_device_id(self):
-        identifier = DEVICE_ID
-        bucket_val = "device_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type="device_id"
-            )
-            self.assertEqual(variant, "variant_3")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_subreddit_id(self):
-        identifier = SUBREDDIT_ID
-        bucket_val = "subreddit_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "control_1")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_ad_account_id(self):
-        identifier = AD_ACCOUNT_ID
-        bucket_val = "ad_account_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_2")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_business_id(self):
-        identifier = BUSINESS_ID
-        bucket_val = "business_id"
-        self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "control_2")
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_variant_for_identifier_without_expose_bogus_identifier_type(self):
-        identifier = "anything"
-        identifier_type = "blah"
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            with self.assertLogs() as captured:
-                variant = decider.get_variant_for_identifier_without_expose(
-                    experiment_name="exp_1", identifier=identifier, identifier_type=identifier_type
-                )
-
-                self.assertEqual(variant, None)
-
-                assert any(
-                    "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
-                    in x.getMessage()
-                    for x in captured.records
-                )
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_all_variants_without_expose(self):
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_without_expose()
-
-            self.assertEqual(len(variant_arr), len(self.exp_base_config))
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"),
-                {"id": 1, "name": "variant_4", "version": "2", "experimentName": "exp_1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
+        self.assertEqual(len(variant_arr), len(self.exp_base_config))
+        variants_by_name = index_by_key(variant_arr, "experimentName")
+        self.assertEqual(
+            variants_by_name.get("exp_1"),
+            {"id": 1, "name": "variant_4", "version": "2", "experimentName": "exp_1"},
+        )
+        self.assertEqual(
+            variants_by_name.get("e1"),
+            {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+        )
+        self.assertEqual(
+            variants_by_name.get("e2"),
+            {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+        )
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
     def test_get_all_variants_without_expose_with_hg(self):
-        # include an HG to test event still emitted for bulk call
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
+        # include an HG to test event still emitted for bulk call, plus 2 more experiments
+        self.exp_base_config = self.EXP_BASE_HG_TWO_CONFIG
 
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_without_expose()
+        variant_arr = decider.get_all_variants_without_expose()
 
-            # "exp_1" returns variant None (due to "hg") and is excluded from the response arr
-            self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"), None
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "hg"),
-                {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
-            )
+        # "exp_1" returns variant None (due to "hg") and is excluded from the response arr
+        self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
+        variants_by_name = index_by_key(variant_arr, "experimentName")
+        self.assertEqual(variants_by_name.get("exp_1"), None)
+        self.assertEqual(
+            variants_by_name.get("e1"),
+            {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+        )
+        self.assertEqual(
+            variants_by_name.get("e2"),
+            {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+        )
+        self.assertEqual(
+            variants_by_name.get("hg"),
+            {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
+        )
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
 
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_exposure_event_fields(
-                experiment_name="hg", variant="holdout", event_fields=event_fields
-            )
+        # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
+        self.assert_exposure_event_fields(
+            experiment_name="hg", variant="holdout", event_fields=event_fields
+        )
 
     def test_get_all_variants_without_expose_ctx_missing_device_id(self):
         # no device_id in ctx
         dc = DeciderContext(user_id=USER_ID)
 
+        self.exp_base_config = deepcopy(self.EXP_BASE_TWO_CONFIG)
         self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": "device_id"})
-        self.exp_base_config.update(self.additional_two_exp)
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, dc, self.mock_span, self.event_logger)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        decider = self.setup_decider(self.exp_base_config, dc)
 
-            decision_arr = decider.get_all_variants_without_expose()
+        decision_arr = decider.get_all_variants_without_expose()
 
-            # device_id experiment not bucketed since
-            # device_id is missing in ctx
-            self.assertEqual(len(decision_arr), 2)
+        # device_id experiment not bucketed since
+        # device_id is missing in ctx
+        self.assertEqual(len(decision_arr), 2)
 
-            self.assertEqual(
-                first_occurrence_of_key_in(decision_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(decision_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
+        decisions_by_name = index_by_key(decision_arr, "experimentName")
+        self.assertEqual(
+            decisions_by_name.get("e1"),
+            {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+        )
+        self.assertEqual(
+            decisions_by_name.get("e2"),
+            {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+        )
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
-    def test_get_all_variants_for_identifier_without_expose_user_id(self):
-        identifier = USER_ID
-        bucket_val = "user_id"
+    def test_get_all_variants_for_identifier_without_expose(self):
+        for identifier, bucket_val, expected_exp_1_variant in (
+            (USER_ID, "user_id", "variant_4"),
+            (DEVICE_ID, "device_id", "variant_3"),
+        ):
+            with self.subTest(bucket_val=bucket_val):
+                self.event_logger.reset()
+                # add 2 more experiments
+                self.exp_base_config = deepcopy(self.EXP_BASE_TWO_CONFIG)
 
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
+                for exp_name in self.exp_base_config.keys():
+                    self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+                decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
+                variant_arr = decider.get_all_variants_for_identifier_without_expose(
+                    identifier=identifier, identifier_type=bucket_val
+                )
 
-            self.assertEqual(len(variant_arr), len(self.exp_base_config))
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"),
-                {"id": 1, "name": "variant_4", "version": "2", "experimentName": "exp_1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
+                self.assertEqual(len(variant_arr), len(self.exp_base_config))
+                variants_by_name = index_by_key(variant_arr, "experimentName")
+                self.assertEqual(
+                    variants_by_name.get("exp_1"),
+                    {
+                        "id": 1,
+                        "name": expected_exp_1_variant,
+                        "version": "2",
+                        "experimentName": "exp_1",
+                    },
+                )
+                self.assertEqual(
+                    variants_by_name.get("e1"),
+                    {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+                )
+                self.assertEqual(
+                    variants_by_name.get("e2"),
+                    {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+                )
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+                # no exposures should be triggered
+                self.assertEqual(self.event_logger.log_count, 0)
 
     def test_get_all_variants_for_identifier_without_expose_user_id_wrong_bucket(self):
         identifier = USER_ID
         bucket_val = "user_id"
 
         # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
+        self.exp_base_config = deepcopy(self.EXP_BASE_TWO_CONFIG)
         # alter `bucket_val` on exp_1 to induce err() due to `identifier_type` mismatch
         self.exp_base_config["exp_1"]["experiment"].update({"bucket_val": "device_id"})
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(
-                f, self.minimal_decider_context, self.mock_span, self.event_logger
-            )
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        decider = self.setup_decider(self.exp_base_config, self.minimal_decider_context)
 
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
-
-            # "exp_1" returns err() (due to bucket_val/`identifier_type` mismatch) and is excluded from the response dict
-            self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"), None
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_all_variants_for_identifier_without_expose_user_id_with_hg(self):
-        identifier = USER_ID
-        bucket_val = "user_id"
-
-        # include an HG to test event still emitted for bulk call
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
-
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
-
-            # "exp_1" returns variant None (due to "hg") and is excluded from the response dict
-            self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"), None
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "hg"),
-                {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
-            )
-
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="hg", variant="holdout", event_fields=event_fields
-            )
-
-    def test_get_all_variants_for_identifier_without_expose_device_id(self):
-        identifier = DEVICE_ID
-        bucket_val = "device_id"
-
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
-
-        for exp_name in self.exp_base_config.keys():
-            self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
-
-            self.assertEqual(len(variant_arr), len(self.exp_base_config))
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"),
-                {"id": 1, "name": "variant_3", "version": "2", "experimentName": "exp_1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        variant_arr = decider.get_all_variants_for_identifier_without_expose(
+            identifier=identifier, identifier_type=bucket_val
+        )
 
-    def test_get_all_variants_for_identifier_without_expose_device_id_with_hg(self):
-        identifier = DEVICE_ID
-        bucket_val = "device_id"
+        # "exp_1" returns err() (due to bucket_val/`identifier_type` mismatch) and is excluded from the response dict
+        self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
+        variants_by_name = index_by_key(variant_arr, "experimentName")
+        self.assertEqual(variants_by_name.get("exp_1"), None)
+        self.assertEqual(
+            variants_by_name.get("e1"),
+            {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+        )
+        self.assertEqual(
+            variants_by_name.get("e2"),
+            {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+        )
 
-        # include an HG to test event still emitted for bulk call
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
+    def test_get_all_variants_for_identifier_without_expose_with_hg(self):
+        for identifier, bucket_val in (
+            (USER_ID, "user_id"),
+            (DEVICE_ID, "device_id"),
+            (CANONICAL_URL, "canonical_url"),
+        ):
+            with self.subTest(bucket_val=bucket_val):
+                self.event_logger.reset()
+                # include an HG to test event still emitted for bulk call, plus 2 more experiments
+                self.exp_base_config = deepcopy(self.EXP_BASE_HG_TWO_CONFIG)
 
-        for exp_name in self.exp_base_config.keys():
-            self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
+                for exp_name in self.exp_base_config.keys():
+                    self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+                decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
+                variant_arr = decider.get_all_variants_for_identifier_without_expose(
+                    identifier=identifier, identifier_type=bucket_val
+                )
 
-            # "exp_1" returns variant None (due to "hg") and is excluded from the response dict
-            self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"), None
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "hg"),
-                {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
-            )
+                # "exp_1" returns variant None (due to "hg") and is excluded from the response dict
+                self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
+                variants_by_name = index_by_key(variant_arr, "experimentName")
+                self.assertEqual(variants_by_name.get("exp_1"), None)
+                self.assertEqual(
+                    variants_by_name.get("e1"),
+                    {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+                )
+                self.assertEqual(
+                    variants_by_name.get("e2"),
+                    {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
+                )
+                self.assertEqual(
+                    variants_by_name.get("hg"),
+                    {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
+                )
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="hg",
-                variant="holdout",
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+                # exposure assertions
+                self.assertEqual(self.event_logger.log_count, 1)
+                event_fields = self.event_logger.last_kwargs
+
+                # `variant == None` for holdout but event will fire with `variant == "holdout"`
+                # for analysis
+                self.assert_minimal_exposure_event_fields(
+                    experiment_name="hg",
+                    variant="holdout",
+                    event_fields=event_fields,
+                    bucket_val=bucket_val,
+                    identifier=identifier,
+                )
 
     def test_get_all_variants_for_identifier_without_expose_canonical_url(self):
         identifier = CANONICAL_URL
         bucket_val = "canonical_url"
 
         # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
+        self.exp_base_config = deepcopy(self.EXP_BASE_TWO_CONFIG)
 
         # update 2 of 3 experiments to have bucket_val: 'canonical_url'
         # so that the 3rd one is filtered out
         for exp_name in list(self.exp_base_config.keys())[0:2]:
             self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
-
-            # non-canonical_url experiment is not included in result
-            self.assertEqual(len(variant_arr), 2)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"),
-                {"id": 1, "name": "variant_3", "version": "2", "experimentName": "exp_1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
-
-    def test_get_all_variants_for_identifier_without_expose_canonical_url_with_hg(self):
-        identifier = CANONICAL_URL
-        bucket_val = "canonical_url"
-
-        # include an HG to test event still emitted for bulk call
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
-        self.exp_base_config.update(self.parent_hg_config)
-
-        # add 2 more experiments
-        self.exp_base_config.update(self.additional_two_exp)
-
-        for exp_name in self.exp_base_config.keys():
-            self.exp_base_config[exp_name]["experiment"].update({"bucket_val": bucket_val})
-
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                identifier=identifier, identifier_type=bucket_val
-            )
+        variant_arr = decider.get_all_variants_for_identifier_without_expose(
+            identifier=identifier, identifier_type=bucket_val
+        )
 
-            # "exp_1" returns variant None (due to "hg") and is excluded from the response dict
-            self.assertEqual(len(variant_arr), len(self.exp_base_config) - 1)
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "exp_1"), None
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e1"),
-                {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "e2"),
-                {"id": 7, "name": "e2treat", "version": "5", "experimentName": "e2"},
-            )
-            self.assertEqual(
-                first_occurrence_of_key_in(variant_arr, "experimentName", "hg"),
-                {"id": 2, "name": "holdout", "version": "5", "experimentName": "hg"},
-            )
+        # non-canonical_url experiment is not included in result
+        self.assertEqual(len(variant_arr), 2)
+        variants_by_name = index_by_key(variant_arr, "experimentName")
+        self.assertEqual(
+            variants_by_name.get("exp_1"),
+            {"id": 1, "name": "variant_3", "version": "2", "experimentName": "exp_1"},
+        )
+        self.assertEqual(
+            variants_by_name.get("e1"),
+            {"id": 6, "name": "e1treat", "version": "4", "experimentName": "e1"},
+        )
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-
-            # `variant == None` for holdout but event will fire with `variant == "holdout"` for analysis
-            self.assert_minimal_exposure_event_fields(
-                experiment_name="hg",
-                variant="holdout",
-                event_fields=event_fields,
-                bucket_val=bucket_val,
-                identifier=identifier,
-            )
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
     def test_get_all_variants_for_identifier_without_expose_bogus_identifier_type(self):
         identifier = "anything"
         # use non-supported `identifier_type`
         identifier_type = "blah"
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        decider = self.setup_base_decider()
 
-            with self.assertLogs() as captured:
-                variant_arr = decider.get_all_variants_for_identifier_without_expose(
-                    identifier=identifier, identifier_type=identifier_type
-                )
+        with capture_logs(logging.WARNING) as records:
+            variant_arr = decider.get_all_variants_for_identifier_without_expose(
+                identifier=identifier, identifier_type=identifier_type
+            )
 
-                self.assertEqual(len(variant_arr), 0)
+            self.assertEqual(len(variant_arr), 0)
 
-                assert any(
-                    "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
-                    in x.getMessage()
-                    for x in captured.records
-                )
+            messages = "\n".join(x.getMessage() for x in records)
+            assert (
+                "\"blah\" is not one of supported \"identifier_type\": ['user_id', 'device_id', 'canonical_url', 'subreddit_id', 'ad_account_id', 'business_id']."
+                in messages
+            )
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
 
     def test_get_variant_with_exposure_kwargs(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_base_decider()
 
-            exp_kwargs = {"foo": "test_1", "bar": "test_2"}
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant(experiment_name="exp_1", **exp_kwargs)
-            self.assertEqual(variant, "variant_4")
+        exp_kwargs = {"foo": "test_1", "bar": "test_2"}
+        variant = decider.get_variant(experiment_name="exp_1", **exp_kwargs)
+        self.assertEqual(variant, "variant_4")
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
-            self.assert_exposure_event_fields(
-                experiment_name="exp_1", variant=variant, event_fields=event_fields
-            )
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
+        self.assert_exposure_event_fields(
+            experiment_name="exp_1", variant=variant, event_fields=event_fields
+        )
 
-            # additional kwargs logged
-            self.assertEqual(event_fields["foo"], exp_kwargs["foo"])
-            self.assertEqual(event_fields["bar"], exp_kwargs["bar"])
+        # additional kwargs logged
+        self.assertEqual(event_fields["foo"], exp_kwargs["foo"])
+        self.assertEqual(event_fields["bar"], exp_kwargs["bar"])
 
-            self.assertEqual(event_fields["inputs"]["foo"], exp_kwargs["foo"])
-            self.assertEqual(event_fields["inputs"]["bar"], exp_kwargs["bar"])
+        self.assertEqual(event_fields["inputs"]["foo"], exp_kwargs["foo"])
+        self.assertEqual(event_fields["inputs"]["bar"], exp_kwargs["bar"])
 
     def test_get_variant_with_disabled_exp(self):
         self.exp_base_config["exp_1"].update({"enabled": False})
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant(experiment_name="exp_1")
-            self.assertEqual(variant, None)
+        variant = decider.get_variant(experiment_name="exp_1")
+        self.assertEqual(variant, None)
 
-            # exposure assertions
-            self.assertEqual(self.event_logger.log.call_count, 0)
+        # exposure assertions
+        self.assertEqual(self.event_logger.log_count, 0)
 
     def test_get_experiment(self):
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_base_decider()
 
-            experiment = decider.get_experiment("exp_1")
+        experiment = decider.get_experiment("exp_1")
 
-            cfg = self.exp_base_config["exp_1"]
-            self.assertEqual(experiment.id, cfg["id"])
-            self.assertEqual(experiment.name, cfg["name"])
-            self.assertEqual(experiment.version, cfg["version"])
-            self.assertEqual(experiment.bucket_val, cfg["experiment"]["bucket_val"])
-            self.assertEqual(experiment.start_ts, cfg["start_ts"])
-            self.assertEqual(experiment.stop_ts, cfg["stop_ts"])
-            self.assertEqual(experiment.owner, cfg["owner"])
-            self.assertEqual(experiment.emit_event, True)
+        cfg = self.exp_base_config["exp_1"]
+        self.assertEqual(experiment.id, cfg["id"])
+        self.assertEqual(experiment.name, cfg["name"])
+        self.assertEqual(experiment.version, cfg["version"])
+        self.assertEqual(experiment.bucket_val, cfg["experiment"]["bucket_val"])
+        self.assertEqual(experiment.start_ts, cfg["start_ts"])
+        self.assertEqual(experiment.stop_ts, cfg["stop_ts"])
+        self.assertEqual(experiment.owner, cfg["owner"])
+        self.assertEqual(experiment.emit_event, True)
 
     def test_get_variant_without_expose_with_HG_as_control_1_and_child_returns_none_does_expose(
         self,
     ):
-        self.exp_base_config["exp_1"].update({"parent_hg_name": "hg"})
+        self.exp_base_config = deepcopy(self.EXP_BASE_HG_CONFIG)
         # force child "exp_1" to return `None`
         self.exp_base_config["exp_1"]["experiment"]["variants"] = [
             {"name": "control_1", "size": 0.0, "range_end": 0.0, "range_start": 0.0},
         ]
 
-        self.exp_base_config.update(self.parent_hg_config)
         # force "hg" to bucket "control_1"
         self.exp_base_config["hg"]["experiment"]["variants"] = [
             {"name": "control_1", "size": 1.00, "range_end": 1.0, "range_start": 0},
             {"name": "holdout", "size": 0.00, "range_end": 0.0, "range_start": 0.00},
         ]
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_without_expose("exp_1")
+        variant = decider.get_variant_without_expose("exp_1")
 
-            assert variant is None
+        assert variant is None
 
-            # exposure from control_1 of "hg"
-            self.assertEqual(self.event_logger.log.call_count, 1)
-            event_fields = self.event_logger.log.call_args[1]
+        # exposure from control_1 of "hg"
+        self.assertEqual(self.event_logger.log_count, 1)
+        event_fields = self.event_logger.last_kwargs
 
-            # `variant == None` for child but event will fire with `variant == "control_1"` for analysis
-            self.assert_exposure_event_fields(
-                experiment_name="hg", variant="control_1", event_fields=event_fields
-            )
+        # `variant == None` for child but event will fire with `variant == "control_1"` for analysis
+        self.assert_exposure_event_fields(
+            experiment_name="hg", variant="control_1", event_fields=event_fields
+        )
 
     def test_get_variant_for_okta_groups(self):
         identifier = "t2_test"
@@ -1593,115 +1409,143 @@ class TestDeciderGetVariantAndExpose(unittest.TestCase):
         }
         self.exp_base_config.update(og_cfg)
 
-        with create_temp_config_file(self.exp_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.exp_base_config)
 
-            self.assertEqual(self.event_logger.log.call_count, 0)
-            variant = decider.get_variant_for_identifier_without_expose(
-                experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
-            )
-            self.assertEqual(variant, "variant_2")
-
-            self.dc._user_id = identifier
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-            variant = decider.get_variant_without_expose(experiment_name="exp_1")
-            self.assertEqual(variant, "variant_2")
+        variant = decider.get_variant_for_identifier_without_expose(
+            experiment_name="exp_1", identifier=identifier, identifier_type=bucket_val
+        )
+        self.assertEqual(variant, "variant_2")
+
+        dc = copy(self.dc)
+        dc._user_id = identifier
+        decider = self.setup_decider(self.exp_base_config, dc)
+        variant = decider.get_variant_without_expose(experiment_name="exp_1")
+        self.assertEqual(variant, "variant_2")
+
+        # no exposures should be triggered
+        self.assertEqual(self.event_logger.log_count, 0)
+
+
+class TestDeciderGetDynamicConfig(DeciderTestCase):
+    DC_BASE_CONFIG = {
+        "dc_1": {
+            "id": 1,
+            "name": "dc_1",
+            "enabled": True,
+            "version": "2",
+            "type": "dynamic_config",
+            "start_ts": 37173982,
+            "stop_ts": 2147483648,
+            "owner": "test_owner",
+            "experiment": {
+                "experiment_version": 1,
+            },
+        }
+    }
 
-            # no exposures should be triggered
-            self.assertEqual(self.event_logger.log.call_count, 0)
+    # regular experiments alongside the dynamic configs in `test_get_all_values`
+    EXPERIMENTS_CONFIG = {
+        "genexp_0": {
+            "id": 6299,
+            "name": "genexp_0",
+            "enabled": True,
+            "owner": "test",
+            "version": "5",
+            "emit_event": True,
+            "type": "range_variant",
+            "start_ts": 0,
+            "stop_ts": 2147483648,
+            "experiment": {
+                "variants": [
+                    {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
+                    {"range_start": 0.2, "range_end": 0.4, "name": "variant_2"},
+                    {"range_start": 0.4, "range_end": 0.6, "name": "variant_3"},
+                    {"range_start": 0.6, "range_end": 0.8, "name": "variant_4"},
+                    {"range_start": 0.8, "range_end": 1.0, "name": "variant_5"},
+                ],
+                "experiment_version": 5,
+                "shuffle_version": 91,
+                "bucket_val": "user_id",
+                "log_bucketing": False,
+            },
+        },
+        "exp_0": {
+            "id": 3248,
+            "name": "exp_0",
+            "enabled": True,
+            "owner": "test",
+            "version": "2",
+            "type": "range_variant",
+            "emit_event": True,
+            "start_ts": 37173982,
+            "stop_ts": 2147483648,
+            "experiment": {
+                "variants": [
+                    {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
+                    {"range_start": 0.2, "range_end": 0.4, "name": "control_2"},
+                    {"range_start": 0.4, "range_end": 0.6, "name": "variant_2"},
+                    {"range_start": 0.6, "range_end": 0.8, "name": "variant_3"},
+                    {"range_start": 0.8, "range_end": 1.0, "name": "variant_4"},
+                ],
+                "experiment_version": 2,
+                "shuffle_version": 91,
+                "bucket_val": "user_id",
+                "log_bucketing": False,
+            },
+        },
+        "exp_1": {
+            "id": 3246,
+            "name": "exp_1",
+            "enabled": True,
+            "owner": "test",
+            "version": "2",
+            "type": "range_variant",
+            "emit_event": True,
+            "start_ts": 37173982,
+            "stop_ts": 2147483648,
+            "experiment": {
+                "variants": [{"range_start": 0, "range_end": 0, "name": "variant_0"}],
+                "experiment_version": 2,
+                "shuffle_version": 0,
+                "bucket_val": "user_id",
+                "log_bucketing": False,
+            },
+        },
+    }
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dc = DeciderContext(**DECIDER_CONTEXT_FIELDS)
 
-class TestDeciderGetDynamicConfig(unittest.TestCase):
     def setUp(self):
         super().setUp()
-        self.event_logger = mock.Mock(spec=DebugLogger)
-        self.mock_span = mock.MagicMock(spec=ServerSpan)
-        self.mock_span.context = None
-        self.minimal_decider_context = DeciderContext()
-        self.dc_base_config = {
-            "dc_1": {
-                "id": 1,
-                "name": "dc_1",
-                "enabled": True,
-                "version": "2",
-                "type": "dynamic_config",
-                "start_ts": 37173982,
-                "stop_ts": 2147483648,
-                "owner": "test_owner",
-                "experiment": {
-                    "experiment_version": 1,
-                },
-            }
-        }
-        self.dc = DeciderContext(
-            user_id=USER_ID,
-            logged_in=IS_LOGGED_IN,
-            country_code=COUNTRY_CODE,
-            locale=LOCALE_CODE,
-            origin_service=ORIGIN_SERVICE,
-            user_is_employee=True,
-            device_id=DEVICE_ID,
-            oauth_client_id=AUTH_CLIENT_ID,
-            cookie_created_timestamp=COOKIE_CREATED_TIMESTAMP,
-            loid_created_timestamp=LOID_CREATED_TIMESTAMP,
+        self.dc_base_config = deepcopy(self.DC_BASE_CONFIG)
+
+    def test_get_typed_values(self):
+        map_val = {"key": "value", "another_key": "another_value"}
+        # (name, value_type, value, getter, expected, mismatched getter, its default)
+        cases = (
+            ("dc_bool", "Boolean", True, "get_bool", True, "get_float", 0.0),
+            ("dc_int", "Integer", 7, "get_int", 7, "get_float", 7.0),
+            ("dc_float", "Float", 4.20, "get_float", 4.20, "get_int", 0),
+            ("dc_string", "Text", "helloworld!", "get_string", "helloworld!", "get_int", 0),
+            ("dc_map", "Map", map_val, "get_map", map_val, "get_string", ""),
         )
 
-    def test_get_bool(self):
-        self.dc_base_config["dc_1"].update({"value_type": "Boolean", "value": True})
-
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            res = decider.get_bool("dc_1")
-            self.assertEqual(res, True)
-            res = decider.get_float("dc_1")
-            self.assertEqual(res, 0.0)
-
-    def test_get_int(self):
-        self.dc_base_config["dc_1"].update({"value_type": "Integer", "value": 7})
-
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            res = decider.get_int("dc_1")
-            self.assertEqual(res, 7)
-            res = decider.get_float("dc_1")
-            self.assertEqual(res, 7.0)
-
-    def test_get_float(self):
-        self.dc_base_config["dc_1"].update({"value_type": "Float", "value": 4.20})
-
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            res = decider.get_float("dc_1")
-            self.assertEqual(res, 4.20)
-            res = decider.get_int("dc_1")
-            self.assertEqual(res, 0)
-
-    def test_get_string(self):
-        self.dc_base_config["dc_1"].update({"value_type": "Text", "value": "helloworld!"})
-
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            res = decider.get_string("dc_1")
-            self.assertEqual(res, "helloworld!")
-            res = decider.get_int("dc_1")
-            self.assertEqual(res, 0)
-
-    def test_get_map(self):
-        self.dc_base_config["dc_1"].update(
-            {"value_type": "Map", "value": {"key": "value", "another_key": "another_value"}}
+        # one manifest holding a config per value type, shared by every case
+        base_cfg = self.DC_BASE_CONFIG["dc_1"]
+        decider = self.setup_decider(
+            {
+                name: {**base_cfg, "name": name, "value_type": value_type, "value": value}
+                for name, value_type, value, *_ in cases
+            }
         )
 
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
-
-            res = decider.get_map("dc_1")
-            self.assertEqual(res, dict({"key": "value", "another_key": "another_value"}))
-            res = decider.get_string("dc_1")
-            self.assertEqual(res, "")
+        for name, _, _, getter, expected, other_getter, other_expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(decider, getter)(name), expected)
+                self.assertEqual(getattr(decider, other_getter)(name), other_expected)
 
     def test_get_map_disabled(self):
         self.dc_base_config["dc_1"].update(
@@ -1709,57 +1553,36 @@ class TestDeciderGetDynamicConfig(unittest.TestCase):
         )
         self.dc_base_config["dc_1"].update({"enabled": False})
 
-        with create_temp_config_file(self.dc_base_config) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
+        decider = self.setup_decider(self.dc_base_config)
 
-            res = decider.get_map("dc_1")
-            self.assertEqual(res, None)
+        res = decider.get_map("dc_1")
+        self.assertEqual(res, None)
 
-    def test_get_all_values(self):
-        base_cfg = self.dc_base_config["dc_1"].copy()
+    def test_get_all_dynamic_configs_returns_fresh_map_values(self):
+        map_val = {"k": "v", "nested": {"k": "v"}}
+        self.dc_base_config["dc_1"].update({"value_type": "Map", "value": deepcopy(map_val)})
 
-        bool_val = True
-        cfg_bool = {"dc_bool": base_cfg.copy()}
-        cfg_bool["dc_bool"].update({"name": "dc_bool", "value": bool_val, "value_type": "Boolean"})
+        decider = self.setup_decider(self.dc_base_config)
 
-        cfg_missing_bool = {}
-        cfg_missing_bool["dc_missing_bool"] = cfg_bool["dc_bool"].copy()
-        cfg_missing_bool["dc_missing_bool"].update({"value": None, "name": "dc_missing_bool"})
+        # mutating one call's result mustn't leak into later calls on the same instance
+        for get_dc in (
+            lambda: decider.get_all_dynamic_configs()[0],
+            lambda: decider.get_all_dynamic_configs_by_name()["dc_1"],
+        ):
+            dc = get_dc()
+            dc["value"]["k"] = "mutated"
+            dc["value"]["nested"]["k"] = "mutated"
 
-        int_val = 99
-        cfg_int = {"dc_int": base_cfg.copy()}
-        cfg_int["dc_int"].update({"name": "dc_int", "value": int_val, "value_type": "Integer"})
+            self.assertEqual(decider.get_all_dynamic_configs()[0]["value"], map_val)
+            self.assertEqual(decider.get_all_dynamic_configs_by_name()["dc_1"]["value"], map_val)
 
-        cfg_missing_int = {}
-        cfg_missing_int["dc_missing_int"] = cfg_int["dc_int"].copy()
-        cfg_missing_int["dc_missing_int"].update({"value": None, "name": "dc_missing_int"})
+    def test_get_all_values(self):
+        base_cfg = self.DC_BASE_CONFIG["dc_1"]
 
+        bool_val = True
+        int_val = 99
         float_val = 3.2
-        cfg_float = {"dc_float": base_cfg.copy()}
-        cfg_float["dc_float"].update(
-            {"name": "dc_float", "value": float_val, "value_type": "Float"}
-        )
-
-        cfg_missing_float = {}
-        cfg_missing_float["dc_missing_float"] = cfg_float["dc_float"].copy()
-        cfg_missing_float["dc_missing_float"].update({"value": None, "name": "dc_missing_float"})
-
         string_val = "some_string"
-        cfg_string = {"dc_string": base_cfg.copy()}
-        cfg_string["dc_string"].update(
-            {"name": "dc_string", "value": string_val, "value_type": "String"}
-        )
-        cfg_text = {"dc_text": base_cfg.copy()}
-        cfg_text["dc_text"].update({"name": "dc_text", "value": string_val, "value_type": "Text"})
-
-        cfg_missing_string = {}
-        cfg_missing_string["dc_missing_string"] = cfg_string["dc_string"].copy()
-        cfg_missing_string["dc_missing_string"].update({"value": None, "name": "dc_missing_string"})
-
-        cfg_missing_text = {}
-        cfg_missing_text["dc_missing_text"] = cfg_text["dc_text"].copy()
-        cfg_missing_text["dc_missing_text"].update({"value": None, "name": "dc_missing_text"})
-
         map_val = {
             "v": {"nested_map": {"w": True, "x": 1, "y": "some_string", "z": 3.0}},
             "w": False,
@@ -1767,13 +1590,36 @@ class TestDeciderGetDynamicConfig(unittest.TestCase):
             "y": "some_string",
             "z": 3.0,
         }
-        cfg_map = {"dc_map": base_cfg.copy()}
-        cfg_map["dc_map"].update({"name": "dc_map", "value": map_val, "value_type": "Map"})
 
-        cfg_missing_map = {}
-        cfg_missing_map["dc_missing_map"] = cfg_map["dc_map"].copy()
-        cfg_missing_map["dc_missing_map"].update({"value": None, "name": "dc_missing_map"})
+        # per type, a "dc_<type>" config with a value & a "dc_missing_<type>" config
+        # without one, which should be set to the type's default value
+        dc_cfgs = {}
+        expected_configs = {}
+        for type_name, value_type, value, result_type, default in (
+            ("bool", "Boolean", bool_val, "boolean", False),
+            ("int", "Integer", int_val, "integer", 0),
+            ("float", "Float", float_val, "float", 0.0),
+            ("string", "String", string_val, "string", ""),
+            ("text", "Text", string_val, "string", ""),
+            ("map", "Map", map_val, "map", {}),
+        ):
+            for name, cfg_value, expected_value in (
+                (f"dc_{type_name}", value, value),
+                (f"dc_missing_{type_name}", None, default),
+            ):
+                dc_cfgs[name] = {
+                    **base_cfg,
+                    "name": name,
+                    "value": cfg_value,
+                    "value_type": value_type,
+                }
+                expected_configs[name] = {
+                    "name": name,
+                    "value": expected_value,
+                    "type": result_type,
+                }
 
+        # missing "value_type" field
         missing_value_type_cfg = {
             "dc_missing_value_type": {
                 "id": 3393,
@@ -1787,182 +1633,26 @@ class TestDeciderGetDynamicConfig(unittest.TestCase):
             }
         }
 
-        experiments_cfg = {
-            "genexp_0": {
-                "id": 6299,
-                "name": "genexp_0",
-                "enabled": True,
-                "owner": "test",
-                "version": "5",
-                "emit_event": True,
-                "type": "range_variant",
-                "start_ts": 0,
-                "stop_ts": 2147483648,
-                "experiment": {
-                    "variants": [
-                        {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
-                        {"range_start": 0.2, "range_end": 0.4, "name": "variant_2"},
-                        {"range_start": 0.4, "range_end": 0.6, "name": "variant_3"},
-                        {"range_start": 0.6, "range_end": 0.8, "name": "variant_4"},
-                        {"range_start": 0.8, "range_end": 1.0, "name": "variant_5"},
-                    ],
-                    "experiment_version": 5,
-                    "shuffle_version": 91,
-                    "bucket_val": "user_id",
-                    "log_bucketing": False,
-                },
-            },
-            "exp_0": {
-                "id": 3248,
-                "name": "exp_0",
-                "enabled": True,
-                "owner": "test",
-                "version": "2",
-                "type": "range_variant",
-                "emit_event": True,
-                "start_ts": 37173982,
-                "stop_ts": 2147483648,
-                "experiment": {
-                    "variants": [
-                        {"range_start": 0.0, "range_end": 0.2, "name": "control_1"},
-                        {"range_start": 0.2, "range_end": 0.4, "name": "control_2"},
-                        {"range_start": 0.4, "range_end": 0.6, "name": "variant_2"},
-                        {"range_start": 0.6, "range_end": 0.8, "name": "variant_3"},
-                        {"range_start": 0.8, "range_end": 1.0, "name": "variant_4"},
-                    ],
-                    "experiment_version": 2,
-                    "shuffle_version": 91,
-                    "bucket_val": "user_id",
-                    "log_bucketing": False,
-                },
-            },
-            "exp_1": {
-                "id": 3246,
-                "name": "exp_1",
-                "enabled": True,
-                "owner": "test",
-                "version": "2",
-                "type": "range_variant",
-                "emit_event": True,
-                "start_ts": 37173982,
-                "stop_ts": 2147483648,
-                "experiment": {
-                    "variants": [{"range_start": 0, "range_end": 0, "name": "variant_0"}],
-                    "experiment_version": 2,
-                    "shuffle_version": 0,
-                    "bucket_val": "user_id",
-                    "log_bucketing": False,
-                },
-            },
+        expected_configs["dc_missing_value_type"] = {
+            "name": "dc_missing_value_type",
+            "value": False,
+            "type": "boolean",
         }
-        experiments_cfg.update(cfg_bool)
-        experiments_cfg.update(cfg_int)
-        experiments_cfg.update(cfg_float)
-        experiments_cfg.update(cfg_string)
-        experiments_cfg.update(cfg_text)
-        experiments_cfg.update(cfg_map)
-
-        # should be set to default values
-        experiments_cfg.update(cfg_missing_bool)
-        experiments_cfg.update(cfg_missing_int)
-        experiments_cfg.update(cfg_missing_float)
-        experiments_cfg.update(cfg_missing_string)
-        experiments_cfg.update(cfg_missing_text)
-        experiments_cfg.update(cfg_missing_map)
-
-        # missing "value_type" field
-        experiments_cfg.update(missing_value_type_cfg)
-
-        with create_temp_config_file(experiments_cfg) as f:
-            decider = setup_decider(f, self.dc, self.mock_span, self.event_logger)
 
-            configs = decider.get_all_dynamic_configs()
+        experiments_cfg = {**self.EXPERIMENTS_CONFIG, **dc_cfgs, **missing_value_type_cfg}
 
-            # 6 correct DCs, 6 DCs w/ values set to respective defaults
-            # 1 `missing_value_type_cfg` which sets "type" to empty string
-            # (3 regular experiments are excluded)
-            self.assertEqual(len(configs), 13)
+        decider = self.setup_decider(experiments_cfg)
 
-            # test values get set
-            bool_val_res = first_occurrence_of_key_in(configs, "name", "dc_bool")
-            self.assertEqual(
-                bool_val_res,
-                {"name": "dc_bool", "value": bool_val, "type": "boolean"},
-            )
+        configs = decider.get_all_dynamic_configs()
 
-            int_val_res = first_occurrence_of_key_in(configs, "name", "dc_int")
-            self.assertEqual(
-                int_val_res,
-                {"name": "dc_int", "value": int_val, "type": "integer"},
-            )
+        # 6 correct DCs, 6 DCs w/ values set to respective defaults
+        # 1 `missing_value_type_cfg` which sets "type" to empty string
+        # (3 regular experiments are excluded)
+        self.assertEqual(len(configs), 13)
 
-            float_val_res = first_occurrence_of_key_in(configs, "name", "dc_float")
-            self.assertEqual(
-                float_val_res,
-                {"name": "dc_float", "value": float_val, "type": "float"},
-            )
-
-            string_val_res = first_occurrence_of_key_in(configs, "name", "dc_string")
-            self.assertEqual(
-                string_val_res,
-                {"name": "dc_string", "value": string_val, "type": "string"},
-            )
-
-            text_val_res = first_occurrence_of_key_in(configs, "name", "dc_text")
-            self.assertEqual(
-                text_val_res,
-                {"name": "dc_text", "value": string_val, "type": "string"},
-            )
-
-            map_val_res = first_occurrence_of_key_in(configs, "name", "dc_map")
-            self.assertEqual(
-                map_val_res,
-                {"name": "dc_map", "value": map_val, "type": "map"},
-            )
-
-            # test default values
-            missing_bool_val_res = first_occurrence_of_key_in(configs, "name", "dc_missing_bool")
-            self.assertEqual(
-                missing_bool_val_res,
-                {"name": "dc_missing_bool", "value": False, "type": "boolean"},
-            )
-
-            missing_int_val_res = first_occurrence_of_key_in(configs, "name", "dc_missing_int")
-            self.assertEqual(
-                missing_int_val_res,
-                {"name": "dc_missing_int", "value": 0, "type": "integer"},
-            )
-
-            missing_float_val_res = first_occurrence_of_key_in(configs, "name", "dc_missing_float")
-            self.assertEqual(
-                missing_float_val_res,
-                {"name": "dc_missing_float", "value": 0.0, "type": "float"},
-            )
-
-            missing_string_val_res = first_occurrence_of_key_in(
-                configs, "name", "dc_missing_string"
-            )
-            self.assertEqual(
-                missing_string_val_res,
-                {"name": "dc_missing_string", "value": "", "type": "string"},
-            )
-
-            missing_text_val_res = first_occurrence_of_key_in(configs, "name", "dc_missing_text")
-            self.assertEqual(
-                missing_text_val_res,
-                {"name": "dc_missing_text", "value": "", "type": "string"},
-            )
-
-            missing_map_val_res = first_occurrence_of_key_in(configs, "name", "dc_missing_map")
-            self.assertEqual(
-                missing_map_val_res,
-                {"name": "dc_missing_map", "value": {}, "type": "map"},
-            )
-
-            missing_map_val_res = first_occurrence_of_key_in(
-                configs, "name", "dc_missing_value_type"
-            )
-            self.assertEqual(
-                missing_map_val_res,
-                {"name": "dc_missing_value_type", "value": False, "type": "boolean"},
-            )
+        configs_by_name = decider.get_all_dynamic_configs_by_name()
+        self.assertEqual(configs_by_name, index_by_key(configs, "name"))
+        self.assertEqual(configs_by_name.keys(), expected_configs.keys())
+        for name, expected in expected_configs.items():
+            with self.subTest(name=name):
+                self.assertEqual(configs_by_name[name], expected)
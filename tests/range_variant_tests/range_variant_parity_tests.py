@@ -1,12 +1,12 @@
 import json
 import unittest
+import warnings
 
+from types import SimpleNamespace
 from unittest import mock
 
-from baseplate import ServerSpan
 from baseplate.lib.events import DebugLogger
 from baseplate.lib.file_watcher import FileWatcher
-from reddit_edgecontext import AuthenticationToken
 from reddit_edgecontext import User
 
 from reddit_decider import Decider
@@ -16,7 +16,6 @@ from reddit_experiments import Experiments
 
 ORIGINAL_ZK_CONFIG_FILE = "tests/range_variant_tests/data/original_zk_config.json"
 RANGE_VARIANT_ZK_CONFIG_FILE = "tests/range_variant_tests/data/range_variant_zk_config.json"
-RESULTS_OUTPUT = "tests/range_variant_tests/data/output.json"
 NUMBER_OF_TEST_USERS = 1000
 
 
@@ -29,11 +28,8 @@ class TestExperiments(unittest.TestCase):
             self.range_variant_zk_file = f
             self.range_variant_zk_config = json.load(f)
         self.mock_filewatcher = mock.Mock(spec=FileWatcher)
-        self.mock_span = mock.MagicMock(spec=ServerSpan)
-        self.mock_span.context = None
-        self.mock_span.trace_id = "123456"
-        self.mock_authentication_token = mock.Mock(spec=AuthenticationToken)
-        self.mock_authentication_token.user_roles = set()
+        # the span is only passed along to the event logger, so a spec'd mock isn't needed
+        self.mock_span = SimpleNamespace(context=None, trace_id="123456")
         self.event_logger = mock.Mock(spec=DebugLogger)
 
     def test_range_variant_bucketing_with_cfg_data(self):
@@ -54,56 +50,59 @@ class TestExperiments(unittest.TestCase):
         rs_decider = init_decider_parser(self.range_variant_zk_file)
         extracted_fields = {"app_name": "", "build_number": 0}
 
-        # results = {}
-        for experiment_name in self.original_zk_config.keys():
-            for i in range(NUMBER_OF_TEST_USERS):
-                uuid = "t2_" + str(i)
-
-                # experiments sdk
-                self.mock_authentication_token.subject = uuid
-                user = User(
-                    authentication_token=self.mock_authentication_token,
-                    loid_=uuid,
-                    cookie_created_ms=10000,
-                )
-
-                og_variant = original_experiments.variant(
-                    experiment_name, user=user, **extracted_fields
-                )
-                rv_variant = rv_experiments.variant(experiment_name, user=user, **extracted_fields)
+        # users only depend on the uuid, so build them once for all experiments; each gets its
+        # own token, which is only read for its `subject` & `user_roles`
+        uuids = [f"t2_{i}" for i in range(NUMBER_OF_TEST_USERS)]
+        users = [
+            User(
+                authentication_token=SimpleNamespace(subject=uuid, user_roles=set()),
+                loid_=uuid,
+                cookie_created_ms=10000,
+            )
+            for uuid in uuids
+        ]
+        # a `Decider` caches its user's context, so one per user is reused across experiments
+        deciders = [
+            Decider(
+                decider_context=DeciderContext(user_id=uuid, extracted_fields=extracted_fields),
+                internal=rs_decider,
+                server_span=self.mock_span,
+                context_name="test",
+                event_logger=self.event_logger,
+            )
+            for uuid in uuids
+        ]
+
+        # the loop deliberately exercises the deprecated `reddit_experiments` API; recording its
+        # per-call deprecation warnings would dominate the runtime. `warn_deprecated()` attributes
+        # them to this module, so they're matched by message rather than `module=`
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                message=r"`\w+\(\)` in `reddit_experiments` module is deprecated",
+                category=DeprecationWarning,
+            )
+
+            for experiment_name in self.original_zk_config.keys():
+                og_variants = []
+                rv_variants = []
+                decider_variants = []
+                for user, decider in zip(users, deciders):
+                    # experiments sdk
+                    og_variants.append(
+                        original_experiments.variant(experiment_name, user=user, **extracted_fields)
+                    )
+                    rv_variants.append(
+                        rv_experiments.variant(experiment_name, user=user, **extracted_fields)
+                    )
+
+                    # decider sdk
+                    decider_variants.append(decider.get_variant(experiment_name=experiment_name))
+
+                # variants are compared once per experiment; on failure, the list diff's first
+                # differing index is the user's position in `uuids`
 
                 # compare experiments sdk in original data format to range-variants format
-                if og_variant != rv_variant:
-                    print(f"\n\nexperiment: {experiment_name}")
-                    print(f"uuid: {uuid}")
-                    print(f"original variant: {og_variant}")
-                    print(f"rv variant: {rv_variant}")
-                self.assertEqual(og_variant, rv_variant)
-
-                # decider sdk
-                decider_context = DeciderContext(user_id=uuid, extracted_fields=extracted_fields)
-
-                decider = Decider(
-                    decider_context=decider_context,
-                    internal=rs_decider,
-                    server_span=self.mock_span,
-                    context_name="test",
-                    event_logger=self.event_logger,
-                )
-
-                decider_variant = decider.get_variant(experiment_name=experiment_name)
-
+                self.assertEqual(og_variants, rv_variants, experiment_name)
                 # compare decider sdk to original experiments sdk in range-variant format
-                if decider_variant != rv_variant:
-                    print(f"\n\nexperiment: {experiment_name}")
-                    print(f"uuid: {uuid}")
-                    print(f"rv variant: {rv_variant}")
-                    print(f"decider variant: {decider_variant}")
-                self.assertEqual(decider_variant, rv_variant)
-
-                # construct experiment/uuid to variant mapping
-                # used to compare results across baseplate languages
-                # results[experiment_name + ':' + uuid] = og_variant
-
-        # with open(RESULTS_OUTPUT, "w") as f:
-        #     json.dump(results, f)
+                self.assertEqual(decider_variants, rv_variants, experiment_name)